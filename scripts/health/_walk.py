@@ -0,0 +1,35 @@
+"""
+目录遍历工具
+基于 os.scandir 的文件遍历，复用 DirEntry 自带的类型/stat 缓存，避免重复 stat 系统调用
+"""
+import os
+from typing import Iterable, Iterator, Tuple
+
+
+def iter_files(root, exclusions: Iterable[str] = (), match_dirs: Iterable[str] = ()) -> Iterator[Tuple[str, os.DirEntry]]:
+    """递归遍历 root 下的所有文件，产出 (路径字符串, DirEntry)
+
+    exclusions 中的目录名不会被进入。match_dirs 中的目录名不会被进入，
+    而是作为条目本身产出，供调用方整体处理（如整目录删除）。
+    """
+    excluded = frozenset(exclusions)
+    matched = frozenset(match_dirs)
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in matched:
+                            yield entry.path, entry
+                        elif entry.name not in excluded:
+                            stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                yield entry.path, entry
@@ -2,13 +2,25 @@
 文件清理工具
 专门负责清理项目中的沉积文件和临时文件
 """
+import os
+import shutil
 from pathlib import Path
 from typing import Dict, List, Any
 import logging
 from datetime import datetime, timedelta
 
+from ._walk import iter_files
+
 logger = logging.getLogger(__name__)
 
+# 需要清理的文件模式：*.tmp、*.log、*.pyc、.DS_Store、Thumbs.db 及 __pycache__ 目录
+CLEANUP_SUFFIXES = ('.tmp', '.log', '.pyc')
+CLEANUP_FILE_NAMES = frozenset({'.DS_Store', 'Thumbs.db'})
+CLEANUP_DIR_NAMES = frozenset({'__pycache__'})
+
+# 清理时不进入的目录
+CLEANUP_EXCLUDED_DIRS = frozenset({'.git', 'node_modules', 'venv'})
+
 class FileCleanupUtil:
     """文件清理工具"""
 
@@ -24,45 +36,40 @@ class FileCleanupUtil:
             'issues': []
         }
 
-        # 定义需要清理的文件模式
-        cleanup_patterns = [
-            '*.tmp',
-            '*.log',
-            '*.pyc',
-            '__pycache__',
-            '.DS_Store',
-            'Thumbs.db'
-        ]
-
         total_cleaned = 0
         now = datetime.now()
 
         # 清理日志文件（超过7天的）
         logs_dir = self.project_root / 'logs'
         if logs_dir.exists():
-            for log_file in logs_dir.glob('*.log'):
-                if log_file.stat().st_mtime < (now.timestamp() - 7*24*3600):
-                    try:
-                        log_file.unlink()
-                        total_cleaned += 1
-                    except Exception as e:
-                        result['issues'].append(f"清理日志文件失败 {log_file.name}: {e}")
-                        result['status'] = 'fail'
+            expire_before = now.timestamp() - 7*24*3600
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    # DirEntry.stat() 在 scandir 后带缓存，无需再次 stat
+                    if not entry.name.endswith('.log') or not entry.is_file():
+                        continue
+                    if entry.stat().st_mtime < expire_before:
+                        try:
+                            os.unlink(entry.path)
+                            total_cleaned += 1
+                        except Exception as e:
+                            result['issues'].append(f"清理日志文件失败 {entry.name}: {e}")
+                            result['status'] = 'fail'
 
-        # 清理临时文件
-        for pattern in cleanup_patterns:
-            for file_path in self.project_root.rglob(pattern):
-                try:
-                    if file_path.is_file():
-                        file_path.unlink()
-                        total_cleaned += 1
-                    elif file_path.is_dir():
-                        import shutil
-                        shutil.rmtree(file_path)
-                        total_cleaned += 1
-                except Exception as e:
-                    result['issues'].append(f"清理文件失败 {file_path}: {e}")
-                    result['status'] = 'fail'
+        # 清理临时文件：单次遍历匹配全部模式，__pycache__ 整目录删除、不再进入
+        for file_path, entry in iter_files(self.project_root, CLEANUP_EXCLUDED_DIRS, CLEANUP_DIR_NAMES):
+            name = entry.name
+            if not (name.endswith(CLEANUP_SUFFIXES) or name in CLEANUP_FILE_NAMES or name in CLEANUP_DIR_NAMES):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(file_path)
+                else:
+                    os.unlink(file_path)
+                total_cleaned += 1
+            except Exception as e:
+                result['issues'].append(f"清理文件失败 {file_path}: {e}")
+                result['status'] = 'fail'
 
         result['details']['files_cleaned'] = total_cleaned
         logger.info(f"文件清理完成，清理了 {total_cleaned} 个文件")
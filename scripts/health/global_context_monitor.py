@@ -5,8 +5,11 @@
 """
 
 import os
+import re
 import sys
 import json
+import fnmatch
+import argparse
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
@@ -22,8 +25,10 @@ from scripts.utils.file_utils import read_json, write_json
 class GlobalContextMonitor:
     """全局上下文监控器"""
 
-    def __init__(self):
+    def __init__(self, sample_limit: Optional[int] = None):
         self.logger = get_script_logger("global_context_monitor")
+        # 孤立文件/缺失关联列表最多保留的条数；默认 None 保留完整列表，*_count 计数始终完整
+        self.sample_limit = sample_limit
         self.project_root = project_root
         self.context_config_path = self.project_root / "scripts" / "health" / "global_context_config.json"
 
@@ -62,6 +67,7 @@ class GlobalContextMonitor:
                     "critical_paths": list(self.critical_paths.keys()),
                     "file_associations": self.file_associations,
                     "exclusions": [".git", "__pycache__", ".pytest_cache", "node_modules"],
+                    "exclusion_globs": ["*.egg-info"],
                     "monitoring": {
                         "enabled": True,
                         "real_time": False,
@@ -74,21 +80,31 @@ class GlobalContextMonitor:
             self.logger.error(f"加载上下文配置失败: {e}")
             return {}
 
-    def scan_project_structure(self) -> Dict[str, Any]:
+    def scan_project_structure(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """扫描项目结构"""
         scan_result = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "total_files": 0,
             "total_dirs": 0,
             "path_status": {},
             "file_associations": {},
             "orphaned_files": [],
+            "orphaned_files_count": 0,
             "missing_associations": [],
+            "missing_associations_count": 0,
             "integrity_issues": []
         }
 
         config = self.load_context_config()
-        exclusions = set(config.get("exclusions", []))
+        self._exclude_names = frozenset(config.get("exclusions", []))
+        globs = config.get("exclusion_globs", [])
+        # 通配排除规则合并编译为一个正则，遍历时只做一次匹配
+        self._exclude_re = re.compile("|".join(fnmatch.translate(g) for g in globs)) if globs else None
+
+        # 热循环中使用的属性提前绑定为局部变量
+        names = self._exclude_names
+        exclude_match = self._exclude_re.match if self._exclude_re else None
+        check_file_associations = self.check_file_associations
 
         for path_name, path_obj in self.critical_paths.items():
             if not path_obj.exists():
@@ -101,23 +117,24 @@ class GlobalContextMonitor:
             # 递归扫描路径
             for root, dirs, files in os.walk(path_obj):
                 # 排除不需要的目录
-                dirs[:] = [d for d in dirs if d not in exclusions]
+                if exclude_match is None:
+                    dirs[:] = [d for d in dirs if d not in names]
+                else:
+                    dirs[:] = [d for d in dirs if d not in names and not exclude_match(d)]
 
                 scan_result["total_dirs"] += len(dirs)
                 scan_result["total_files"] += len(files)
 
-                # 检查文件关联性
+                # 检查文件关联性（同目录文件集合只构建一次，关联检查全部走集合查找）
+                siblings = set(files)
                 for file in files:
-                    file_path = Path(root) / file
-                    self.check_file_associations(file_path, scan_result)
+                    check_file_associations(root, file, siblings, scan_result)
 
         return scan_result
 
-    def check_file_associations(self, file_path: Path, scan_result: Dict[str, Any]):
+    def check_file_associations(self, root: str, file_name: str, siblings: Set[str], scan_result: Dict[str, Any]):
         """检查文件关联性"""
-        file_ext = file_path.suffix
-        file_name = file_path.name
-        dir_path = file_path.parent
+        stem, file_ext = os.path.splitext(file_name)
 
         # 检查关联文件
         expected_associations = self.file_associations.get(file_ext, [])
@@ -125,37 +142,46 @@ class GlobalContextMonitor:
         for assoc in expected_associations:
             if assoc.startswith("."):
                 # 扩展名关联
-                expected_file = file_path.with_suffix(assoc)
+                expected_name = stem + assoc
             else:
                 # 文件名关联
-                expected_file = dir_path / assoc
-
-            if not expected_file.exists():
-                scan_result["missing_associations"].append({
-                    "file": str(file_path),
-                    "expected": str(expected_file),
-                    "type": "association"
-                })
+                expected_name = assoc
+
+            if expected_name not in siblings:
+                scan_result["missing_associations_count"] += 1
+                sample = scan_result["missing_associations"]
+                if self.sample_limit is None or len(sample) < self.sample_limit:
+                    sample.append({
+                        "file": os.path.join(root, file_name),
+                        "expected": os.path.join(root, expected_name),
+                        "type": "association"
+                    })
 
         # 检查孤立文件
-        if self.is_orphaned_file(file_path):
-            scan_result["orphaned_files"].append(str(file_path))
+        if self.is_orphaned_file(file_name, siblings):
+            scan_result["orphaned_files_count"] += 1
+            sample = scan_result["orphaned_files"]
+            if self.sample_limit is None or len(sample) < self.sample_limit:
+                sample.append(os.path.join(root, file_name))
 
-    def is_orphaned_file(self, file_path: Path) -> bool:
-        """检查是否为孤立文件"""
+    # 压缩/映射文件后缀 -> 对应源文件后缀
+    _MIN_SUFFIXES = ((".min.js", ".js"), (".min.css", ".css"))
+
+    def is_orphaned_file(self, name: str, siblings: Set[str]) -> bool:
+        """检查是否为孤立文件（仅基于同目录文件名集合判断，不访问文件系统）"""
         # 检查是否有对应的配置文件
-        if file_path.suffix == ".py":
-            config_file = file_path.with_suffix("_config.json")
-            readme_file = file_path.with_suffix("_README.md")
-            if not config_file.exists() and not readme_file.exists():
+        if name.endswith(".py"):
+            stem = name[:-3]
+            if stem + "_config.json" not in siblings and stem + "_README.md" not in siblings:
                 return True
 
         # 检查是否有对应的源文件
-        if file_path.suffix in [".min.js", ".min.css", ".map"]:
-            base_name = file_path.name.split(".")[0]
-            source_file = file_path.parent / f"{base_name}{file_path.suffix.replace('.min', '').replace('.map', '')}"
-            if not source_file.exists():
-                return True
+        for suffix, source_suffix in self._MIN_SUFFIXES:
+            if name.endswith(suffix):
+                return name[:-len(suffix)] + source_suffix not in siblings
+
+        if name.endswith(".map"):
+            return name[:-4] not in siblings
 
         return False
 
@@ -201,23 +227,35 @@ class GlobalContextMonitor:
 
     def check_path_references(self, config: Dict[str, Any], config_file: str, integrity_report: Dict[str, Any]):
         """检查路径引用"""
-        def check_paths(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
+        if type(config) is not dict and type(config) is not list:
+            return
+        path_references = integrity_report["path_references"]
+        project_root = self.project_root
+        # 显式栈迭代（栈中保存各容器的迭代器，结果顺序与递归先序一致）；
+        # 只有字典的值按路径检查，列表只向下展开其中的容器
+        stack = [(iter(config.items()) if type(config) is dict else enumerate(config), "", type(config) is list)]
+        while stack:
+            items, path, is_list = stack[-1]
+            for key, value in items:
+                is_container = type(value) is dict or type(value) is list
+                if is_list:
+                    if not is_container:
+                        continue
+                    current_path = f"{path}[{key}]"
+                else:
                     current_path = f"{path}.{key}" if path else key
-                    if isinstance(value, (str, Path)) and str(value).startswith("/"):
-                        full_path = self.project_root / str(value).lstrip("/")
-                        if not full_path.exists():
-                            integrity_report["path_references"][f"{config_file}:{current_path}"] = "broken"
-                        else:
-                            integrity_report["path_references"][f"{config_file}:{current_path}"] = "valid"
-                    else:
-                        check_paths(value, current_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    check_paths(item, f"{path}[{i}]")
-
-        check_paths(config)
+                    if type(value) is str:
+                        if value[:1] == "/":
+                            full_path = project_root / value.lstrip("/")
+                            path_references[f"{config_file}:{current_path}"] = "valid" if full_path.exists() else "broken"
+                        continue
+                    if not is_container:
+                        continue
+                children = iter(value.items()) if type(value) is dict else enumerate(value)
+                stack.append((children, current_path, type(value) is list))
+                break
+            else:
+                stack.pop()
 
     def check_python_imports(self, integrity_report: Dict[str, Any]):
         """检查Python导入依赖"""
@@ -276,7 +314,6 @@ class GlobalContextMonitor:
                         content = f.read()
 
                     # 查找文件引用
-                    import re
                     refs = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
                     for text, link in refs:
                         if link.startswith(('../', './', '/')):
@@ -288,11 +325,12 @@ class GlobalContextMonitor:
                 except Exception as e:
                     self.logger.warning(f"检查文档引用失败: {md_file}")
 
-    def generate_integrity_report(self) -> Dict[str, Any]:
+    def generate_integrity_report(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """生成完整性报告"""
+        timestamp = timestamp or datetime.now().isoformat()
         report = {
-            "timestamp": datetime.now().isoformat(),
-            "structure_scan": self.scan_project_structure(),
+            "timestamp": timestamp,
+            "structure_scan": self.scan_project_structure(timestamp),
             "context_integrity": self.check_global_context_integrity(),
             "summary": {}
         }
@@ -305,8 +343,8 @@ class GlobalContextMonitor:
             "total_files": structure["total_files"],
             "total_dirs": structure["total_dirs"],
             "missing_paths": len([p for p in structure["path_status"].values() if p == "missing"]),
-            "orphaned_files": len(structure["orphaned_files"]),
-            "missing_associations": len(structure["missing_associations"]),
+            "orphaned_files": structure["orphaned_files_count"],
+            "missing_associations": structure["missing_associations_count"],
             "broken_references": len(integrity.get("path_references", {})),
             "import_issues": len(integrity.get("import_dependencies", {})),
             "cross_ref_issues": len(integrity.get("cross_references", {})),
@@ -340,8 +378,12 @@ class GlobalContextMonitor:
         print("🔍 AI弹窗项目全局上下文监控器")
         print("=" * 60)
 
+        # 本次运行只取一次时间，报告字段与文件名共用
+        now = datetime.now()
+        ts_file = now.strftime('%Y%m%d_%H%M%S')
+
         # 生成完整性报告
-        report = self.generate_integrity_report()
+        report = self.generate_integrity_report(now.isoformat())
 
         print(f"扫描时间: {report['timestamp']}")
         print(f"项目健康度: {report['summary']['overall_health'].upper()}")
@@ -371,7 +413,7 @@ class GlobalContextMonitor:
                 print(f"- ... 还有 {len(issues) - 10} 个问题")
 
         # 保存报告
-        report_path = self.project_root / "logs" / f"context_integrity_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report_path = self.project_root / "logs" / f"context_integrity_{ts_file}.json"
         write_json(report_path, report)
 
         print(f"\n✅ 完整性报告已保存: {report_path}")
@@ -379,5 +421,10 @@ class GlobalContextMonitor:
         self.logger.info("全局上下文监控器运行完成")
 
 if __name__ == "__main__":
-    monitor = GlobalContextMonitor()
+    parser = argparse.ArgumentParser(description="全局上下文监控器")
+    parser.add_argument("--sample-limit", type=int, default=None,
+                        help="孤立文件/缺失关联列表最多保留的条数（默认保留完整列表）")
+    args = parser.parse_args()
+
+    monitor = GlobalContextMonitor(sample_limit=args.sample_limit)
     monitor.run()
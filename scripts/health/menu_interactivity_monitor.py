@@ -9,8 +9,9 @@ import sys
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根目录到路径
 project_root = Path(__file__).parent.parent.parent
@@ -18,6 +19,129 @@ sys.path.insert(0, str(project_root))
 
 from scripts.utils.logging_utils import get_script_logger
 from scripts.utils.file_utils import read_json, write_json
+from scripts.health._walk import iter_files
+
+# 预编译的扫描模式（模块加载时编译一次，所有文件共用）
+# 所有模式均为 ASCII，直接在原始字节上匹配，省去 UTF-8 解码
+SUBMENU_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    rb'class="[^"]*submenu[^"]*"',
+    rb'class="[^"]*dropdown[^"]*"',
+    rb'class="[^"]*sub-menu[^"]*"',
+    rb'<ul[^>]*class="[^"]*sub[^"]*">'
+)]
+MEDIA_RE = re.compile(rb'@media[^{]*\{[^}]*\}', re.DOTALL)
+Z_INDEX_RE = re.compile(rb'z-index:\s*(\d+)')
+UL_TAG_RE = re.compile(rb'</ul>|<ul')
+
+# (报告名称, 匹配字节串)
+HTML_MENU_SELECTORS = tuple((name, name.encode()) for name in (
+    "nav", "menu", ".menu", ".navbar", "#nav", "#menu"
+))
+
+# JS 扫描的全部字面量：(报告分类, 名称, 匹配字节串)，一张表一次遍历完成
+# 逐个 `in` 走的是 C 层子串搜索；实测在 web/static/js 上与 Aho-Corasick（pyahocorasick）
+# 耗时相当，且后者只接受 str 需额外解码，因此不引入该依赖
+JS_NEEDLES = (
+    # 事件处理器
+    ("event_handlers", ".on", b".on("),
+    ("event_handlers", ".click", b".click("),
+    ("event_handlers", ".hover", b".hover("),
+    ("event_handlers", ".mouseenter", b".mouseenter("),
+    ("event_handlers", ".mouseleave", b".mouseleave("),
+    ("event_handlers", "addEventListener", b"addEventListener("),
+    # 菜单相关函数
+    ("menu_functions", "toggleMenu", b"toggleMenu"),
+    ("menu_functions", "showMenu", b"showMenu"),
+    ("menu_functions", "hideMenu", b"hideMenu"),
+    ("menu_functions", "openSubmenu", b"openSubmenu"),
+    ("menu_functions", "closeSubmenu", b"closeSubmenu"),
+    # 互动性模式
+    ("interactivity_patterns", "preventDefault", b"preventDefault"),
+    ("interactivity_patterns", "stopPropagation", b"stopPropagation"),
+    ("interactivity_patterns", "stopImmediatePropagation", b"stopImmediatePropagation"),
+    ("interactivity_patterns", "toggleClass", b"toggleClass"),
+    ("interactivity_patterns", "addClass", b"addClass"),
+    ("interactivity_patterns", "removeClass", b"removeClass"),
+)
+JS_BUCKETS = ("event_handlers", "menu_functions", "interactivity_patterns")
+
+# (报告名称, 匹配字节串)
+CSS_MENU_SELECTORS = tuple((name, name.encode()) for name in (
+    ".menu", ".navbar", ".nav", ".main-menu",
+    ".submenu", ".dropdown-menu", ".sub-menu"
+))
+
+# 单个文件最多扫描的字节数，超出部分（多为打包/压缩产物）不再读取
+MAX_SCAN_BYTES = 2_000_000
+
+# 压缩产物判定：文件头部 MINIFIED_PEEK_BYTES 字节内换行少于 MINIFIED_MIN_NEWLINES 个
+MINIFIED_PEEK_BYTES = 4096
+MINIFIED_MIN_NEWLINES = 4
+
+# 逐文件分析缓存格式版本，分析逻辑变化时递增使旧缓存失效
+FILE_CACHE_VERSION = 4
+
+
+def scan_ul_tags(content: bytes) -> Tuple[int, int]:
+    """单次扫描 UL 标签，返回 (<ul 数量, </ul> 数量)"""
+    opened = closed = 0
+    for match in UL_TAG_RE.finditer(content):
+        if match.end() - match.start() == 5:  # </ul>
+            closed += 1
+        else:
+            opened += 1
+    return opened, closed
+
+
+def has_nested_ul(content: bytes) -> bool:
+    """检查是否依次出现 <ul…>、<ul…>、</ul>、</ul>（逐段 find，避免 .*? 回溯）
+
+    与原正则 <ul[^>]*>.*?<ul[^>]*>.*?</ul>.*?</ul> 的判定一致：
+    每个 <ul 取其后第一个 > 作为标签结束，下一段从该位置之后开始查找。
+    """
+    pos = 0
+    for _ in range(2):
+        start = content.find(b'<ul', pos)
+        if start == -1:
+            return False
+        pos = content.find(b'>', start + 3)
+        if pos == -1:
+            return False
+        pos += 1
+    for _ in range(2):
+        pos = content.find(b'</ul>', pos)
+        if pos == -1:
+            return False
+        pos += 5
+    return True
+
+
+def has_nested_menu_events(content: bytes) -> bool:
+    """检查 .menu 之后是否依次出现 .on(、任意 "."、.on(（逐段 find，避免 .* 回溯）"""
+    pos = content.find(b'.menu')
+    if pos == -1:
+        return False
+    pos = content.find(b'.on(', pos + 5)
+    if pos == -1:
+        return False
+    pos = content.find(b'.', pos + 4)
+    if pos == -1:
+        return False
+    return content.find(b'.on(', pos + 1) != -1
+
+
+def is_minified_bundle(file_path: str, content: bytes) -> bool:
+    """按文件名（.min.）或头部换行密度判断是否为压缩打包产物"""
+    if '.min.' in os.path.basename(file_path):
+        return True
+    head = content[:MINIFIED_PEEK_BYTES]
+    return len(head) == MINIFIED_PEEK_BYTES and head.count(b'\n') < MINIFIED_MIN_NEWLINES
+
+
+def issue_records(file_path: str, issues: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+    """把逐文件检查得到的 (类型, 描述) 元组转换为报告中的问题记录"""
+    return [{"file": file_path, "type": issue_type, "description": description}
+            for issue_type, description in issues]
 
 class MenuInteractivityMonitor:
     """菜单互动性监控器"""
@@ -26,6 +150,12 @@ class MenuInteractivityMonitor:
         self.logger = get_script_logger("menu_interactivity_monitor")
         self.project_root = project_root
         self.menu_config_path = self.project_root / "scripts" / "health" / "menu_interactivity_config.json"
+        self.file_cache_path = self.project_root / "scripts" / "health" / "menu_interactivity_cache.json"
+
+        # 逐文件分析结果缓存：路径 -> {"signature": [mtime_ns, size], "result": ...}
+        # 仅在 run() 中启用；_file_cache 为上次结果，_next_file_cache 收集本次结果
+        self._file_cache: Optional[Dict[str, Any]] = None
+        self._next_file_cache: Dict[str, Any] = {}
 
         # 定义需要检查的文件类型
         self.checkable_files = {
@@ -66,6 +196,71 @@ class MenuInteractivityMonitor:
             self.logger.error(f"加载菜单配置失败: {e}")
             return {}
 
+    def _find_files(self, root: Path, suffix: str) -> List[str]:
+        """用 os.scandir 遍历 root，返回指定后缀的文件路径
+
+        路径字符串在此统一生成并驻留（sys.intern），后续报告各分类中的同一路径共享同一对象。
+        """
+        return [sys.intern(path) for path, entry in iter_files(root) if entry.name.endswith(suffix)]
+
+    def _read_source(self, file_path: str) -> Tuple[bytes, bool]:
+        """以字节方式读取待扫描文件，返回 (内容, 是否被截断)
+
+        超过 MAX_SCAN_BYTES 时只读取前段内容。
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MAX_SCAN_BYTES:
+                self.logger.warning("文件过大，仅扫描前 %d 字节: %s", MAX_SCAN_BYTES, file_path)
+                return f.read(MAX_SCAN_BYTES), True
+            return f.read(), False
+
+    def load_file_cache(self):
+        """加载逐文件分析缓存（版本不符或损坏时视为空缓存）"""
+        self._file_cache = {}
+        self._next_file_cache = {}
+        try:
+            if self.file_cache_path.exists():
+                cache = read_json(self.file_cache_path)
+                if cache.get("version") == FILE_CACHE_VERSION:
+                    self._file_cache = cache.get("files", {})
+        except Exception as e:
+            self.logger.warning("加载分析缓存失败: %s", e)
+
+    def save_file_cache(self):
+        """保存本次运行的逐文件分析缓存（只保留本次仍存在的文件）"""
+        if self._file_cache is None:
+            return
+        try:
+            write_json(self.file_cache_path, {"version": FILE_CACHE_VERSION, "files": self._next_file_cache})
+        except Exception as e:
+            self.logger.warning("保存分析缓存失败: %s", e)
+
+    def _analyze_cached(self, func, file_path: str) -> Optional[Dict[str, Any]]:
+        """文件 mtime 与大小未变化时直接复用上次的分析结果"""
+        if self._file_cache is None:
+            return func(file_path)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return func(file_path)
+
+        signature = [st.st_mtime_ns, st.st_size]
+        entry = self._file_cache.get(file_path)
+        if entry is not None and entry.get("signature") == signature:
+            result = entry["result"]
+        else:
+            result = func(file_path)
+        if result is not None:
+            self._next_file_cache[file_path] = {"signature": signature, "result": result}
+        return result
+
+    def _map_files(self, func, files: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """并发执行逐文件分析（命中缓存的文件跳过扫描），结果顺序与输入一致"""
+        if len(files) <= 1:
+            return [self._analyze_cached(func, f) for f in files]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(lambda f: self._analyze_cached(func, f), files))
+
     def analyze_menu_structure(self) -> Dict[str, Any]:
         """分析菜单结构"""
         structure_report = {
@@ -79,69 +274,68 @@ class MenuInteractivityMonitor:
         # 查找HTML文件
         web_templates = self.project_root / "web" / "templates"
         if web_templates.exists():
-            html_files = list(web_templates.rglob("*.html"))
-            structure_report["html_files"] = [str(f) for f in html_files]
-
-            for html_file in html_files:
-                self.analyze_html_menu_structure(html_file, structure_report)
+            html_files = self._find_files(web_templates, ".html")
+            structure_report["html_files"] = list(html_files)
+
+            # 逐文件分析互不依赖，并发执行后按顺序合并
+            for result in self._map_files(self.analyze_html_menu_structure, html_files):
+                if result is None:
+                    continue
+                for selector in result["menu_elements"]:
+                    structure_report["menu_elements"].setdefault(selector, []).append(result["file"])
+                if result["submenu_elements"]:
+                    structure_report["submenu_elements"].setdefault(result["file"], []).extend(result["submenu_elements"])
+                structure_report["structure_violations"].extend(issue_records(result["file"], result["structure_violations"]))
 
         return structure_report
 
-    def analyze_html_menu_structure(self, html_file: Path, report: Dict[str, Any]):
-        """分析HTML菜单结构"""
+    def analyze_html_menu_structure(self, html_file: str) -> Optional[Dict[str, Any]]:
+        """分析单个HTML文件的菜单结构，返回该文件的分析结果（失败时返回None）"""
         try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content, truncated = self._read_source(html_file)
+
+            result = {
+                "file": html_file,
+                "menu_elements": [],
+                "submenu_elements": [],
+                "structure_violations": []
+            }
 
             # 检查菜单元素
-            menu_selectors = ["nav", "menu", ".menu", ".navbar", "#nav", "#menu"]
-            for selector in menu_selectors:
-                if selector in content:
-                    if selector not in report["menu_elements"]:
-                        report["menu_elements"][selector] = []
-                    report["menu_elements"][selector].append(str(html_file))
+            for selector, needle in HTML_MENU_SELECTORS:
+                if needle in content:
+                    result["menu_elements"].append(selector)
 
             # 检查子菜单元素
-            submenu_patterns = [
-                r'class="[^"]*submenu[^"]*"',
-                r'class="[^"]*dropdown[^"]*"',
-                r'class="[^"]*sub-menu[^"]*"',
-                r'<ul[^>]*class="[^"]*sub[^"]*">'
-            ]
-
-            for pattern in submenu_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    if str(html_file) not in report["submenu_elements"]:
-                        report["submenu_elements"][str(html_file)] = []
-                    report["submenu_elements"][str(html_file)].extend(matches)
-
-            # 检查结构违规
-            self.check_menu_structure_violations(content, html_file, report)
+            for pattern in SUBMENU_PATTERNS:
+                result["submenu_elements"].extend(m.decode('utf-8', 'replace') for m in pattern.findall(content))
+
+            # 检查结构违规（截断文件的标签配对不完整，不做配对检查）
+            result["structure_violations"] = self.check_menu_structure_violations(content, truncated)
+            return result
 
         except Exception as e:
-            self.logger.warning(f"分析HTML文件失败: {html_file}")
+            self.logger.warning("分析HTML文件失败: %s", html_file)
+            return None
+
+    def check_menu_structure_violations(self, content: bytes, truncated: bool = False) -> List[Tuple[str, str]]:
+        """检查菜单结构违规，返回 (类型, 描述) 列表
+
+        truncated 为 True 时内容只是文件前段，截断处之后的关闭标签不可见，跳过标签配对检查。
+        """
+        violations = []
+
+        open_ul, close_ul = scan_ul_tags(content)
 
-    def check_menu_structure_violations(self, content: str, html_file: Path, report: Dict[str, Any]):
-        """检查菜单结构违规"""
         # 检查嵌套深度
-        nested_ul_pattern = r'<ul[^>]*>.*?<ul[^>]*>.*?</ul>.*?</ul>'
-        if re.search(nested_ul_pattern, content, re.DOTALL):
-            report["structure_violations"].append({
-                "file": str(html_file),
-                "type": "deep_nesting",
-                "description": "检测到过深的菜单嵌套"
-            })
+        if has_nested_ul(content):
+            violations.append(("deep_nesting", "检测到过深的菜单嵌套"))
 
         # 检查缺少关闭标签
-        open_ul = content.count('<ul')
-        close_ul = content.count('</ul>')
-        if open_ul != close_ul:
-            report["structure_violations"].append({
-                "file": str(html_file),
-                "type": "unclosed_tags",
-                "description": f"UL标签不匹配: {open_ul} 个打开, {close_ul} 个关闭"
-            })
+        if not truncated and open_ul != close_ul:
+            violations.append(("unclosed_tags", f"UL标签不匹配: {open_ul} 个打开, {close_ul} 个关闭"))
+
+        return violations
 
     def analyze_javascript_interactivity(self) -> Dict[str, Any]:
         """分析JavaScript互动性"""
@@ -159,95 +353,69 @@ class MenuInteractivityMonitor:
             self.project_root / "src" / "frontend"
         ]
 
+        skipped = 0
         for js_path in js_paths:
             if js_path.exists():
-                js_files = list(js_path.rglob("*.js"))
-                js_report["js_files"].extend([str(f) for f in js_files])
-
-                for js_file in js_files:
-                    self.analyze_js_file(js_file, js_report)
+                js_files = self._find_files(js_path, ".js")
+                js_report["js_files"].extend(js_files)
+
+                for result in self._map_files(self.analyze_js_file, js_files):
+                    if result is None:
+                        continue
+                    if result.get("skipped"):
+                        skipped += 1
+                        continue
+                    for key in JS_BUCKETS:
+                        bucket = js_report[key]
+                        for name in result[key]:
+                            bucket.setdefault(name, []).append(result["file"])
+                    js_report["issues"].extend(issue_records(result["file"], result["issues"]))
+
+        js_report["skipped_minified"] = skipped
+        if skipped:
+            self.logger.info("跳过 %d 个压缩JS文件", skipped)
 
         return js_report
 
-    def analyze_js_file(self, js_file: Path, report: Dict[str, Any]):
-        """分析JavaScript文件"""
+    def analyze_js_file(self, js_file: str) -> Optional[Dict[str, Any]]:
+        """分析单个JavaScript文件，返回该文件的分析结果（失败时返回None）"""
         try:
-            with open(js_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 检查事件处理器
-            event_patterns = [
-                r'\.on\(',
-                r'\.click\(',
-                r'\.hover\(',
-                r'\.mouseenter\(',
-                r'\.mouseleave\(',
-                r'addEventListener\('
-            ]
-
-            for pattern in event_patterns:
-                matches = re.findall(pattern, content)
-                if matches:
-                    event_type = pattern.replace('\\', '').replace('(', '')
-                    if event_type not in report["event_handlers"]:
-                        report["event_handlers"][event_type] = []
-                    report["event_handlers"][event_type].append(str(js_file))
-
-            # 检查菜单相关函数
-            menu_functions = [
-                "toggleMenu",
-                "showMenu",
-                "hideMenu",
-                "openSubmenu",
-                "closeSubmenu"
-            ]
-
-            for func in menu_functions:
-                if func in content:
-                    if func not in report["menu_functions"]:
-                        report["menu_functions"][func] = []
-                    report["menu_functions"][func].append(str(js_file))
-
-            # 检查互动性模式
-            interactivity_patterns = [
-                "preventDefault",
-                "stopPropagation",
-                "stopImmediatePropagation",
-                "toggleClass",
-                "addClass",
-                "removeClass"
-            ]
-
-            for pattern in interactivity_patterns:
-                if pattern in content:
-                    if pattern not in report["interactivity_patterns"]:
-                        report["interactivity_patterns"][pattern] = []
-                    report["interactivity_patterns"][pattern].append(str(js_file))
+            content, _ = self._read_source(js_file)
+
+            # 压缩产物很少包含有意义的菜单代码，且容易拖慢扫描，直接跳过
+            if is_minified_bundle(js_file, content):
+                return {"file": js_file, "skipped": True}
+
+            result = {"file": js_file}
+            for bucket in JS_BUCKETS:
+                result[bucket] = []
+
+            # 事件处理器 / 菜单函数 / 互动模式统一按字面量表检查
+            for bucket, name, needle in JS_NEEDLES:
+                if needle in content:
+                    result[bucket].append(name)
 
             # 检查问题
-            self.check_js_interactivity_issues(content, js_file, report)
+            result["issues"] = self.check_js_interactivity_issues(content)
+            return result
 
         except Exception as e:
-            self.logger.warning(f"分析JS文件失败: {js_file}")
+            self.logger.warning("分析JS文件失败: %s", js_file)
+            return None
+
+    def check_js_interactivity_issues(self, content: bytes) -> List[Tuple[str, str]]:
+        """检查JavaScript互动性问题，返回 (类型, 描述) 列表"""
+        issues = []
 
-    def check_js_interactivity_issues(self, content: str, js_file: Path, report: Dict[str, Any]):
-        """检查JavaScript互动性问题"""
         # 检查事件冒泡问题
-        if ".on(" in content and "stopPropagation" not in content:
-            report["issues"].append({
-                "file": str(js_file),
-                "type": "missing_stopPropagation",
-                "description": "事件处理器可能缺少stopPropagation调用"
-            })
+        if b".on(" in content and b"stopPropagation" not in content:
+            issues.append(("missing_stopPropagation", "事件处理器可能缺少stopPropagation调用"))
 
         # 检查嵌套菜单事件冲突
-        nested_menu_pattern = r'\.menu.*\.on\(.*\..*\.on\('
-        if re.search(nested_menu_pattern, content, re.DOTALL):
-            report["issues"].append({
-                "file": str(js_file),
-                "type": "nested_event_conflict",
-                "description": "检测到嵌套菜单事件可能冲突"
-            })
+        if has_nested_menu_events(content):
+            issues.append(("nested_event_conflict", "检测到嵌套菜单事件可能冲突"))
+
+        return issues
 
     def analyze_css_styling(self) -> Dict[str, Any]:
         """分析CSS样式"""
@@ -267,52 +435,47 @@ class MenuInteractivityMonitor:
 
         for css_path in css_paths:
             if css_path.exists():
-                css_files = list(css_path.rglob("*.css"))
-                css_report["css_files"].extend([str(f) for f in css_files])
-
-                for css_file in css_files:
-                    self.analyze_css_file(css_file, css_report)
+                css_files = self._find_files(css_path, ".css")
+                css_report["css_files"].extend(css_files)
+
+                for result in self._map_files(self.analyze_css_file, css_files):
+                    if result is None:
+                        continue
+                    for selector in result["menu_styles"]:
+                        css_report["menu_styles"].setdefault(selector, []).append(result["file"])
+                    if result["responsive_rules"]:
+                        css_report["responsive_rules"][result["file"]] = result["responsive_rules"]
+                    if result["high_z_indices"]:
+                        css_report["z_index_issues"].append({
+                            "file": result["file"],
+                            "high_z_indices": result["high_z_indices"]
+                        })
 
         return css_report
 
-    def analyze_css_file(self, css_file: Path, report: Dict[str, Any]):
-        """分析CSS文件"""
+    def analyze_css_file(self, css_file: str) -> Optional[Dict[str, Any]]:
+        """分析单个CSS文件，返回该文件的分析结果（失败时返回None）"""
         try:
-            with open(css_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 检查菜单样式
-            menu_selectors = [
-                ".menu", ".navbar", ".nav", ".main-menu",
-                ".submenu", ".dropdown-menu", ".sub-menu"
-            ]
-
-            for selector in menu_selectors:
-                if selector in content:
-                    if selector not in report["menu_styles"]:
-                        report["menu_styles"][selector] = []
-                    report["menu_styles"][selector].append(str(css_file))
-
-            # 检查响应式规则
-            media_queries = re.findall(r'@media[^{]*\{[^}]*\}', content, re.DOTALL)
-            if media_queries:
-                report["responsive_rules"][str(css_file)] = len(media_queries)
-
-            # 检查z-index问题
-            z_index_pattern = r'z-index:\s*(\d+)'
-            z_indices = re.findall(z_index_pattern, content)
-            high_z_indices = [int(z) for z in z_indices if int(z) > 1000]
-            if high_z_indices:
-                report["z_index_issues"].append({
-                    "file": str(css_file),
-                    "high_z_indices": high_z_indices
-                })
+            content, _ = self._read_source(css_file)
+
+            return {
+                "file": css_file,
+                # 检查菜单样式
+                "menu_styles": [selector for selector, needle in CSS_MENU_SELECTORS if needle in content],
+                # 检查响应式规则
+                "responsive_rules": sum(1 for _ in MEDIA_RE.finditer(content)),
+                # 检查z-index问题
+                "high_z_indices": [z for z in map(int, Z_INDEX_RE.findall(content)) if z > 1000]
+            }
 
         except Exception as e:
-            self.logger.warning(f"分析CSS文件失败: {css_file}")
+            self.logger.warning("分析CSS文件失败: %s", css_file)
+            return None
 
-    def check_menu_separation(self) -> Dict[str, Any]:
-        """检查菜单分离"""
+    def check_menu_separation(self, structure: Optional[Dict[str, Any]] = None,
+                              js_analysis: Optional[Dict[str, Any]] = None,
+                              css_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """检查菜单分离（可传入已完成的分析结果，避免重复扫描）"""
         separation_report = {
             "main_sub_separation": True,
             "event_isolation": True,
@@ -322,7 +485,8 @@ class MenuInteractivityMonitor:
         }
 
         # 检查HTML分离
-        structure = self.analyze_menu_structure()
+        if structure is None:
+            structure = self.analyze_menu_structure()
         main_menus = len(structure.get("menu_elements", {}))
         sub_menus = sum(len(items) for items in structure.get("submenu_elements", {}).values())
 
@@ -335,7 +499,8 @@ class MenuInteractivityMonitor:
             separation_report["issues"].append("未检测到子菜单元素")
 
         # 检查JavaScript事件隔离
-        js_analysis = self.analyze_javascript_interactivity()
+        if js_analysis is None:
+            js_analysis = self.analyze_javascript_interactivity()
         event_handlers = js_analysis.get("event_handlers", {})
         menu_functions = js_analysis.get("menu_functions", {})
 
@@ -344,7 +509,8 @@ class MenuInteractivityMonitor:
             separation_report["issues"].append("未检测到菜单相关的事件处理或函数")
 
         # 检查CSS样式隔离
-        css_analysis = self.analyze_css_styling()
+        if css_analysis is None:
+            css_analysis = self.analyze_css_styling()
         menu_styles = css_analysis.get("menu_styles", {})
 
         if not menu_styles:
@@ -355,20 +521,22 @@ class MenuInteractivityMonitor:
 
     def generate_interactivity_report(self) -> Dict[str, Any]:
         """生成互动性报告"""
+        # 三项分析各只执行一次，分离检查直接复用其结果
+        structure = self.analyze_menu_structure()
+        js_analysis = self.analyze_javascript_interactivity()
+        css_analysis = self.analyze_css_styling()
+        separation = self.check_menu_separation(structure, js_analysis, css_analysis)
+
         report = {
             "timestamp": datetime.now().isoformat(),
-            "menu_structure": self.analyze_menu_structure(),
-            "javascript_interactivity": self.analyze_javascript_interactivity(),
-            "css_styling": self.analyze_css_styling(),
-            "menu_separation": self.check_menu_separation(),
+            "menu_structure": structure,
+            "javascript_interactivity": js_analysis,
+            "css_styling": css_analysis,
+            "menu_separation": separation,
             "summary": {}
         }
 
         # 生成摘要
-        structure = report["menu_structure"]
-        js_analysis = report["javascript_interactivity"]
-        css_analysis = report["css_styling"]
-        separation = report["menu_separation"]
 
         report["summary"] = {
             "html_files_checked": len(structure["html_files"]),
@@ -413,8 +581,10 @@ class MenuInteractivityMonitor:
         print("🎯 AI弹窗项目菜单互动性监控器")
         print("=" * 60)
 
-        # 生成互动性报告
+        # 生成互动性报告（未变化的文件复用上次分析结果）
+        self.load_file_cache()
         report = self.generate_interactivity_report()
+        self.save_file_cache()
 
         print(f"检查时间: {report['timestamp']}")
         print(f"整体互动性: {report['summary']['overall_interactivity'].upper()}")
@@ -7,8 +7,22 @@ from typing import Dict, List, Any
 import json
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def load_json_file(path: Path) -> Any:
+    """以字节读取并解析JSON文件，优先使用 orjson"""
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class RulesValidator:
     """规则验证器"""
 
@@ -34,6 +48,9 @@ class RulesValidator:
             'rules.config.js'
         ]
 
+        # 第一遍解析的结果缓存下来，层级依赖检查直接复用
+        parsed = {}
+
         for file in required_files:
             path = rules_dir / file
             if not path.exists():
@@ -42,12 +59,12 @@ class RulesValidator:
             else:
                 try:
                     if file.endswith('.json'):
-                        with open(path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            # 检查基本结构
-                            if 'meta' not in data:
-                                result['issues'].append(f"规则文件结构不完整: {file}")
-                                result['status'] = 'fail'
+                        data = load_json_file(path)
+                        parsed[file] = data
+                        # 检查基本结构
+                        if 'meta' not in data:
+                            result['issues'].append(f"规则文件结构不完整: {file}")
+                            result['status'] = 'fail'
                 except Exception as e:
                     result['issues'].append(f"规则文件解析失败 {file}: {e}")
                     result['status'] = 'fail'
@@ -55,8 +72,8 @@ class RulesValidator:
         # 检查层级依赖
         if result['status'] == 'pass':
             try:
-                l1 = json.loads((rules_dir / 'L1-meta-goal.json').read_text(encoding='utf-8'))
-                l2 = json.loads((rules_dir / 'L2-understanding.json').read_text(encoding='utf-8'))
+                l1 = parsed['L1-meta-goal.json']
+                l2 = parsed['L2-understanding.json']
 
                 # 检查L2是否引用L1
                 if 'goals' in l1 and 'architecture' in l2:
@@ -3,7 +3,8 @@
 专门负责检查项目结构完整性
 """
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+import os
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,21 +42,15 @@ class ProjectStructureChecker:
             'issues': []
         }
 
-        # 检查必需目录
-        missing_dirs = []
-        for dir_path in self.required_structure['dirs']:
-            full_path = self.project_root / dir_path
-            if not full_path.exists():
-                missing_dirs.append(dir_path)
-                result['status'] = 'fail'
+        # 每个父目录只 scandir 一次，之后全部是字典查找（名称 -> 是否为目录）
+        listings: Dict[str, Dict[str, bool]] = {}
 
-        # 检查必需文件
-        missing_files = []
-        for file_path in self.required_structure['files']:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                missing_files.append(file_path)
-                result['status'] = 'fail'
+        # 检查必需目录 / 文件（按类型区分，目录位置上的同名文件不算数）
+        missing_dirs = [d for d in self.required_structure['dirs'] if self._entry_is_dir(d, listings) is not True]
+        missing_files = [f for f in self.required_structure['files'] if self._entry_is_dir(f, listings) is not False]
+
+        if missing_dirs or missing_files:
+            result['status'] = 'fail'
 
         result['details'] = {
             'missing_dirs': missing_dirs,
@@ -64,10 +59,25 @@ class ProjectStructureChecker:
             'total_files_checked': len(self.required_structure['files'])
         }
 
-        if missing_dirs:
-            result['issues'].extend([f"缺少目录: {d}" for d in missing_dirs])
-        if missing_files:
-            result['issues'].extend([f"缺少文件: {f}" for f in missing_files])
+        result['issues'] = [f"缺少目录: {d}" for d in missing_dirs] + [f"缺少文件: {f}" for f in missing_files]
 
         logger.info(f"项目结构检查完成，发现 {len(result['issues'])} 个问题")
         return result
+
+    def _entry_is_dir(self, rel_path: str, listings: Dict[str, Dict[str, bool]]) -> Optional[bool]:
+        """通过父目录的 scandir 结果判断条目类型：目录返回True，文件返回False，不存在返回None"""
+        parent, _, name = rel_path.rpartition('/')
+        entries = listings.get(parent)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(self.project_root / parent) as it:
+                    for entry in it:
+                        try:
+                            entries[entry.name] = entry.is_dir()
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            listings[parent] = entries
+        return entries.get(name)
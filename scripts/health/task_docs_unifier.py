@@ -4,10 +4,23 @@
 """
 from pathlib import Path
 from typing import Dict, List, Any
+import os
+import re
+import mmap
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 任务行（"- [ ] ..." / "- [x] ..."，允许缩进）或缩进的任务详情行
+# [^\S\n] 为除换行外的任意空白，首尾去除范围与 str.strip() 一致（含 \r、全角空格）
+TODO_LINE_RE = re.compile(
+    r'^[^\S\n]*(?P<task>- \[.*?)[^\S\n]*$|^  [^\S\n]*(?P<detail>\S.*?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+# 进度文档中表示已与TODO同步的标记（UTF-8 字节）
+SYNC_MARKERS = ('TODO.md'.encode('utf-8'), '任务'.encode('utf-8'))
+
 class TaskDocsUnifier:
     """任务文档统一器"""
 
@@ -46,11 +59,9 @@ class TaskDocsUnifier:
             for progress_file in progress_files:
                 if progress_file.name.startswith(('01-', '02-', '03-')):
                     try:
-                        with open(progress_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # 检查是否与TODO同步
-                            if 'TODO.md' in content or '任务' in content:
-                                result['details']['synced_docs'] = result['details'].get('synced_docs', 0) + 1
+                        # 检查是否与TODO同步
+                        if self._file_contains_any(progress_file, SYNC_MARKERS):
+                            result['details']['synced_docs'] = result['details'].get('synced_docs', 0) + 1
                     except Exception as e:
                         result['issues'].append(f"进度文档读取失败 {progress_file.name}: {e}")
                         result['status'] = 'fail'
@@ -62,15 +73,22 @@ class TaskDocsUnifier:
         logger.info(f"任务文档统一完成，发现 {len(result['issues'])} 个问题")
         return result
 
+    def _file_contains_any(self, file_path: Path, needles: tuple) -> bool:
+        """通过 mmap 在文件字节中查找任一标记，不把整个文件读入内存"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return any(mm.find(needle) != -1 for needle in needles)
+
     def _parse_todo_content(self, content: str) -> List[Dict[str, Any]]:
         """解析TODO内容"""
         tasks = []
-        lines = content.split('\n')
         current_task = None
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- ['):
+        for match in TODO_LINE_RE.finditer(content):
+            line = match.group('task')
+            if line is not None:
                 # 新任务
                 if current_task:
                     tasks.append(current_task)
@@ -82,9 +100,9 @@ class TaskDocsUnifier:
                     'completed': completed,
                     'details': []
                 }
-            elif current_task and line.startswith('  '):
-                # 任务详情
-                current_task['details'].append(line.strip())
+            elif current_task:
+                # 任务详情（缩进行）
+                current_task['details'].append(match.group('detail'))
 
         if current_task:
             tasks.append(current_task)
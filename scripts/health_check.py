@@ -5,23 +5,40 @@ my_ai_popup_project 自动化健康检测脚本
 支持优雅降级，缺少依赖时仍能运行基础功能
 启动后自动弹窗浏览器（支持多种打开方式）
 """
+import errno
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
 import json
+import selectors
 import socket
 import threading
 import subprocess
 import os
+import random
 import sys
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Set
 
 # 依赖检查和优雅降级
+# GPUtil / Flask / requests 只用 find_spec 探测是否安装，真正的导入推迟到使用它们的函数内，
+# 纯检测路径（不启动Web界面）的启动不再为这些重量级模块付出导入开销
 PSUTIL_AVAILABLE = False
-GPU_AVAILABLE = False
-FLASK_AVAILABLE = False
-REQUESTS_AVAILABLE = False
+
+
+def _module_available(name: str) -> bool:
+    """检查模块是否已安装（不执行模块代码）"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
 
 try:
     import psutil
@@ -30,38 +47,171 @@ except ImportError:
     print("[警告] psutil未安装，系统监控功能将受限")
 
 try:
-    import GPUtil
-    GPU_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
+    ORJSON_AVAILABLE = False
+
+GPU_AVAILABLE = _module_available("GPUtil")
+if not GPU_AVAILABLE:
     print("[警告] GPUtil未安装，GPU监控功能将受限")
 
-try:
-    from flask import Flask, render_template_string, jsonify
-    from werkzeug.serving import run_simple
-    from werkzeug.wsgi import SharedDataMiddleware
-    FLASK_AVAILABLE = True
-except ImportError as e:
-    print(f"[警告] Flask未安装，Web界面功能不可用: {e}")
-    FLASK_AVAILABLE = False
+FLASK_AVAILABLE = _module_available("flask") and _module_available("werkzeug")
+if not FLASK_AVAILABLE:
+    print("[警告] Flask未安装，Web界面功能不可用")
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
+REQUESTS_AVAILABLE = _module_available("requests")
+if not REQUESTS_AVAILABLE:
     print("[警告] requests未安装，API测试功能将受限")
 
 from .path_config import get_project_root, get_web_dir, get_logs_dir
 from .logging_utils import info, warning, error
 
 
+# 本机端口探测的超时：本机往返远小于1毫秒，0.5秒足以区分"未监听"与"响应慢"
+LOCAL_PROBE_TIMEOUT = 0.5
+
+# CPU采样窗口：后台采样线程每轮的窗口，以及尚无后台采样值时的快速采样窗口（秒）
+CPU_SAMPLE_INTERVAL = 1.0
+CPU_QUICK_SAMPLE_INTERVAL = 0.1
+
+# API端点检查：仅对连接失败重试（超时不重试），全部尝试与退避共用同一 timeout 预算；退避基数（秒）与抖动比例
+ENDPOINT_MAX_RETRIES = 3
+ENDPOINT_RETRY_BASE_DELAY = 0.2
+ENDPOINT_RETRY_JITTER = 0.3
+
+# 浏览器打开命令启动后观察的时间（秒）：期间以非0退出码结束视为失败，尝试下一种方式
+BROWSER_EXIT_GRACE = 0.5
+
+# 非阻塞 connect 返回这些错误码表示连接仍在建立中
+_CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+if hasattr(errno, "WSAEWOULDBLOCK"):
+    _CONNECT_PENDING.add(errno.WSAEWOULDBLOCK)
+
+
+def probe_ports(host: str, ports: List[int], timeout: float) -> List[bool]:
+    """
+    批量探测TCP端口是否可连接
+
+    所有端口同时发起非阻塞 connect，并注册到同一个 selector，
+    由一次次 select 统一收割结果，最坏情况只等待一个 timeout，而不是 N 个。
+
+    Args:
+        host: 目标主机
+        ports: 端口列表
+        timeout: 整批探测的超时时间（秒）
+
+    Returns:
+        List[bool]: 与 ports 一一对应的可连接状态
+    """
+    results = [False] * len(ports)
+    selector = selectors.DefaultSelector()
+    try:
+        for index, port in enumerate(ports):
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError:
+                continue
+            sock.setblocking(False)
+            try:
+                code = sock.connect_ex((host, port))
+            except Exception:
+                sock.close()
+                continue
+            if code in _CONNECT_PENDING:
+                selector.register(sock, selectors.EVENT_WRITE, index)
+                continue
+            results[index] = code == 0
+            sock.close()
+
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                sock = key.fileobj
+                results[key.data] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                selector.unregister(sock)
+                sock.close()
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+    return results
+
+
+def find_executables(names: Iterable[str]) -> Set[str]:
+    """
+    单次遍历 PATH，返回 names 中可执行文件存在的命令名
+
+    每个 PATH 目录只访问一次，全部命令找到后提前结束，
+    而不是像逐个调用 shutil.which 那样为每个命令重新遍历一遍 PATH。
+    """
+    remaining = set(names)
+    found: Set[str] = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not remaining:
+            break
+        if not directory:
+            continue
+        for name in list(remaining):
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                found.add(name)
+                remaining.discard(name)
+    return found
+
+
+def scan_dir(path: Path) -> Dict[str, bool]:
+    """单次 scandir 读取目录，返回 条目名 -> 是否为目录；目录不存在时返回空字典"""
+    entries: Dict[str, bool] = {}
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    entries[entry.name] = entry.is_dir()
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return entries
+
+
+@functools.lru_cache(maxsize=None)
+def _load_adapter_class(module_name: str, class_name: str):
+    """导入并缓存引擎适配器类，重复检查时不再走导入流程"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class BrowserLauncher:
     """浏览器启动器 - 支持多种打开方式"""
 
+    # 命令行打开方式 -> 命令前缀（URL 追加在末尾）
+    OPENER_COMMANDS = {
+        "xdg-open": ["xdg-open"],
+        "x-www-browser": ["x-www-browser"],
+        "gnome-open": ["gnome-open"],
+        "kioclient": ["kioclient", "exec"],
+    }
+
+    # 优先级顺序
+    PRIORITY_METHODS = ("xdg-open", "x-www-browser", "gnome-open", "kioclient", "webbrowser")
+
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
+        # 可用打开方式在进程生命周期内不变，缓存避免每次弹窗重复探测
+        self._methods: Optional[List[str]] = None
+        self._desktop: Optional[str] = None
+        self._headless: Optional[bool] = None
 
     def detect_desktop_environment(self) -> str:
-        """检测桌面环境类型"""
+        """检测桌面环境类型（结果在首次调用后缓存）"""
+        if self._desktop is None:
+            self._desktop = self._detect_desktop_environment()
+        return self._desktop
+
+    def _detect_desktop_environment(self) -> str:
         desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
         session = os.environ.get("DESKTOP_SESSION", "").lower()
 
@@ -86,11 +236,16 @@ class BrowserLauncher:
         return bool(display) and display != ""
 
     def is_headless(self) -> bool:
-        """检查是否在无头环境中运行"""
-        return not self.is_display_available()
+        """检查是否在无头环境中运行（结果在首次调用后缓存）"""
+        if self._headless is None:
+            self._headless = not self.is_display_available()
+        return self._headless
 
     def get_available_methods(self) -> List[str]:
-        """获取可用的浏览器打开方式"""
+        """获取可用的浏览器打开方式（结果在首次调用后缓存）"""
+        if self._methods is not None:
+            return self._methods
+
         methods = []
 
         # 检查webbrowser
@@ -100,34 +255,11 @@ class BrowserLauncher:
         except Exception:
             pass
 
-        # 检查xdg-open
-        try:
-            subprocess.run(["which", "xdg-open"], capture_output=True, timeout=5)
-            methods.append("xdg-open")
-        except Exception:
-            pass
-
-        # 检查x-www-browser
-        try:
-            subprocess.run(["which", "x-www-browser"], capture_output=True, timeout=5)
-            methods.append("x-www-browser")
-        except Exception:
-            pass
-
-        # 检查gnome-open (GNOME)
-        try:
-            subprocess.run(["which", "gnome-open"], capture_output=True, timeout=5)
-            methods.append("gnome-open")
-        except Exception:
-            pass
-
-        # 检查kde-open (KDE)
-        try:
-            subprocess.run(["which", "kioclient"], capture_output=True, timeout=5)
-            methods.append("kioclient")
-        except Exception:
-            pass
+        # 检查命令行打开方式：一次遍历 PATH 同时查找全部候选命令，无需 fork `which` 子进程
+        found = find_executables(self.OPENER_COMMANDS)
+        methods.extend(command for command in self.OPENER_COMMANDS if command in found)
 
+        self._methods = methods
         return methods
 
     def open_browser(self, url: str, browser_name: Optional[str] = None) -> bool:
@@ -157,69 +289,56 @@ class BrowserLauncher:
             except Exception as e:
                 warning(f"无法使用指定浏览器 {browser_name}: {e}")
 
-        # 尝试多种打开方式
+        # 尝试多种打开方式：按优先级顺序查表分发
         methods = self.get_available_methods()
+        handlers = {
+            method: (lambda u, prefix=prefix: self._open_with_command(prefix, u))
+            for method, prefix in self.OPENER_COMMANDS.items()
+        }
+        handlers["webbrowser"] = self._open_with_webbrowser
 
-        # 优先级顺序
-        priority_methods = [
-            "xdg-open",
-            "x-www-browser",
-            "gnome-open",
-            "kioclient",
-            "webbrowser",
-        ]
-
-        for method in priority_methods:
+        for method in self.PRIORITY_METHODS:
             if method not in methods:
                 continue
-
             try:
-                if method == "webbrowser":
-                    # 使用webbrowser模块
-                    success = self._open_with_webbrowser(url)
-                    if success:
-                        return True
-
-                elif method == "xdg-open":
-                    success = self._run_command(["xdg-open", url])
-                    if success:
-                        info("已使用 xdg-open 打开浏览器")
-                        return True
-
-                elif method == "x-www-browser":
-                    success = self._run_command(["x-www-browser", url])
-                    if success:
-                        info("已使用 x-www-browser 打开浏览器")
-                        return True
-
-                elif method == "gnome-open":
-                    success = self._run_command(["gnome-open", url])
-                    if success:
-                        info("已使用 gnome-open 打开浏览器")
-                        return True
-
-                elif method == "kioclient":
-                    success = self._run_command(["kioclient", "exec", url])
-                    if success:
-                        info("已使用 kioclient 打开浏览器")
-                        return True
-
+                if handlers[method](url):
+                    return True
             except Exception as e:
                 warning(f"{method} 方式失败: {e}")
-                continue
 
         # 最后尝试webbrowser
         return self._open_with_webbrowser(url)
 
+    def _open_with_command(self, prefix: List[str], url: str) -> bool:
+        """使用命令行打开方式打开"""
+        if self._run_command(prefix + [url]):
+            info(f"已使用 {prefix[0]} 打开浏览器")
+            return True
+        return False
+
     def _run_command(self, cmd: List[str]) -> bool:
-        """运行命令并返回是否成功"""
+        """
+        以分离进程启动命令，最多观察 BROWSER_EXIT_GRACE 秒
+
+        期间命令以非0退出码结束（如 xdg-open 找不到处理程序）返回 False，
+        由调用方尝试下一种方式；仍在运行或正常退出视为成功。
+        浏览器处理程序可能长时间占用标准输出或不退出，这里不等待其结束，
+        避免弹窗路径被阻塞到超时。
+        """
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=self.timeout
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
-            return result.returncode == 0
         except Exception:
             return False
+        try:
+            return proc.wait(timeout=BROWSER_EXIT_GRACE) == 0
+        except subprocess.TimeoutExpired:
+            return True
 
     def _open_with_webbrowser(self, url: str) -> bool:
         """使用webbrowser模块打开"""
@@ -241,41 +360,39 @@ class ServiceChecker:
         self.port = port
         self.timeout = timeout
 
-    def wait_for_service(self, interval: float = 0.5) -> bool:
+    def wait_for_service(self, interval: float = 0.05, max_interval: float = 1.0) -> bool:
         """
-        等待服务就绪
+        等待服务就绪（指数退避轮询：启动初期密集探测，之后逐步放缓）
 
         Args:
-            interval: 检查间隔（秒）
+            interval: 首次检查间隔（秒），之后每次翻倍
+            max_interval: 检查间隔上限（秒）
 
         Returns:
             bool: 服务是否就绪
         """
         start_time = time.time()
+        deadline = start_time + self.timeout
+        delay = interval
 
         info("等待服务启动...")
 
-        while time.time() - start_time < self.timeout:
+        while time.time() < deadline:
             if self._check_connection():
                 elapsed = time.time() - start_time
                 info(f"服务已就绪 (耗时: {elapsed:.1f}秒)")
                 return True
-            time.sleep(interval)
+            # 加入少量随机抖动，避免多个等待方同步轰击同一端口
+            sleep_for = delay + random.uniform(0, delay * 0.1)
+            time.sleep(max(0.0, min(sleep_for, deadline - time.time())))
+            delay = min(delay * 2, max_interval)
 
         warning(f"服务启动超时 ({self.timeout}秒)")
         return False
 
     def _check_connection(self) -> bool:
         """检查服务连接"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex((self.host, self.port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
-
+        return probe_ports(self.host, [self.port], LOCAL_PROBE_TIMEOUT)[0]
 
 class HealthChecker:
     """my_ai_popup_project健康检测器"""
@@ -301,28 +418,40 @@ class HealthChecker:
             "overall_status": "unknown",
         }
 
+        # 复用连接池，避免每个端点检查都重新建立TCP/TLS连接；首次检查端点时才创建
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # 后台CPU采样线程维护的最近一次采样值，check_system 直接读取而不阻塞；
+        # 采样线程只在监控模式下由 start_cpu_sampler 启动，单次检查不创建
+        self._cpu_percent: Optional[float] = None
+        self._cpu_sampler: Optional[threading.Thread] = None
+        self._cpu_sampler_stop = threading.Event()
+
     def _load_config(self) -> Dict:
         if self.config_path.exists():
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            data = self.config_path.read_bytes()
+            if ORJSON_AVAILABLE:
+                return orjson.loads(data)
+            return json.loads(data)
         return {}
 
+    def _is_package_installed(self, package: str) -> bool:
+        """检查包是否已安装（find_spec 只在 sys.path 中定位模块，不执行模块代码）"""
+        try:
+            return importlib.util.find_spec(package.replace("-", "_")) is not None
+        except (ImportError, ValueError):
+            return False
+
     def _get_package_version(self, package: str) -> str:
-        """获取包版本"""
+        """获取包版本（读取已安装包的元数据，不再启动子进程重新导入）"""
         try:
-            result = subprocess.run(
-                [
-                    "python3",
-                    "-c",
-                    f"import {package.replace('-', '_')}; print({package.replace('-', '_')}.__version__)",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return result.stdout.strip() or "unknown"
+            return importlib.metadata.version(package)
         except Exception:
-            return "unknown"
+            pass
+        # 包名与发行名不一致时，回退到已导入模块的 __version__（如有）
+        module = sys.modules.get(package.replace("-", "_"))
+        return str(getattr(module, "__version__", None) or "unknown")
 
     def check_dependencies(self) -> Dict[str, Any]:
         """检查Python依赖包"""
@@ -341,12 +470,8 @@ class HealthChecker:
         if not PSUTIL_AVAILABLE:
             result["warnings"].append("psutil未安装，部分系统监控功能不可用")
 
-        total = len(required) + len(optional)
-        checked = 0
-
         for pkg in required:
-            try:
-                __import__(pkg.replace("-", "_"))
+            if self._is_package_installed(pkg):
                 result["checked_packages"].append(
                     {
                         "name": pkg,
@@ -354,14 +479,11 @@ class HealthChecker:
                         "version": self._get_package_version(pkg),
                     }
                 )
-            except ImportError:
+            else:
                 result["missing_packages"].append(pkg)
-            checked += 1
-            result["progress"] = int(checked / total * 100)
 
         for pkg in optional:
-            try:
-                __import__(pkg.replace("-", "_"))
+            if self._is_package_installed(pkg):
                 result["checked_packages"].append(
                     {
                         "name": pkg,
@@ -370,10 +492,10 @@ class HealthChecker:
                         "version": self._get_package_version(pkg),
                     }
                 )
-            except ImportError:
+            else:
                 result["optional_missing"].append(pkg)
-            checked += 1
-            result["progress"] = int(checked / total * 100)
+
+        result["progress"] = 100
 
         if not result["missing_packages"]:
             result["status"] = "ok" if not result["optional_missing"] else "warning"
@@ -384,28 +506,17 @@ class HealthChecker:
 
     def check_system(self) -> Dict[str, Any]:
         """检查系统资源"""
-        result = {"status": "pending", "progress": 0, "checks": {}, "warnings": []}
-
         if not PSUTIL_AVAILABLE:
-            result["warnings"].append("psutil未安装，跳过系统检查")
-            result["status"] = "warning"
-            result["progress"] = 100
-            result["checks"]["system"] = {
-                "value": "unavailable",
-                "status": "warning",
-                "message": "psutil未安装",
-            }
-            return result
+            return self._system_check_skipped()
+
+        result = {"status": "pending", "progress": 0, "checks": {}, "warnings": []}
 
         thresholds = self.config.get("system_check", {}).get("thresholds", {})
         check_items = self.config.get("system_check", {}).get("check_items", [])
 
-        total = len(check_items)
-        checked = 0
-
         if "cpu_usage" in check_items:
             try:
-                cpu = psutil.cpu_percent(interval=1)
+                cpu = self._read_cpu_percent()
                 status = "ok"
                 if cpu > thresholds.get("cpu_percent_critical", 90):
                     status = "critical"
@@ -424,8 +535,6 @@ class HealthChecker:
                     "status": "error",
                     "message": str(e),
                 }
-            checked += 1
-            result["progress"] = int(checked / total * 100)
 
         if "memory_usage" in check_items:
             try:
@@ -449,8 +558,6 @@ class HealthChecker:
                     "status": "error",
                     "message": str(e),
                 }
-            checked += 1
-            result["progress"] = int(checked / total * 100)
 
         if "disk_usage" in check_items:
             try:
@@ -475,12 +582,12 @@ class HealthChecker:
                     "status": "error",
                     "message": str(e),
                 }
-            checked += 1
-            result["progress"] = int(checked / total * 100)
 
         if "gpu_usage" in check_items:
             if GPU_AVAILABLE:
                 try:
+                    import GPUtil
+
                     gpus = GPUtil.getGPUs()
                     if gpus:
                         gpu = gpus[0]
@@ -517,8 +624,8 @@ class HealthChecker:
                     "status": "warning",
                     "message": "GPUtil未安装",
                 }
-            checked += 1
-            result["progress"] = int(checked / total * 100)
+
+        result["progress"] = 100
 
         statuses = [c.get("status", "ok") for c in result["checks"].values()]
         if "critical" in statuses:
@@ -530,6 +637,62 @@ class HealthChecker:
 
         return result
 
+    def _system_check_skipped(self) -> Dict[str, Any]:
+        """psutil 不可用时的系统层结果"""
+        return {
+            "status": "warning",
+            "progress": 100,
+            "checks": {
+                "system": {
+                    "value": "unavailable",
+                    "status": "warning",
+                    "message": "psutil未安装",
+                }
+            },
+            "warnings": ["psutil未安装，跳过系统检查"],
+        }
+
+    def start_cpu_sampler(self):
+        """启动后台CPU采样线程（监控模式使用，重复调用无副作用）"""
+        if not PSUTIL_AVAILABLE or self._cpu_sampler is not None:
+            return
+        self._cpu_sampler_stop.clear()
+        self._cpu_sampler = threading.Thread(
+            target=self._cpu_sampler_loop, name="cpu-sampler", daemon=True
+        )
+        self._cpu_sampler.start()
+
+    def stop_cpu_sampler(self):
+        """停止后台CPU采样线程"""
+        sampler = self._cpu_sampler
+        if sampler is None:
+            return
+        self._cpu_sampler_stop.set()
+        sampler.join()
+        self._cpu_sampler = None
+        self._cpu_percent = None
+
+    def _cpu_sampler_loop(self):
+        """后台每 CPU_SAMPLE_INTERVAL 秒采样一次CPU使用率，收到停止事件后立即退出"""
+        try:
+            psutil.cpu_percent(interval=None)
+            while not self._cpu_sampler_stop.wait(CPU_SAMPLE_INTERVAL):
+                self._cpu_percent = psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+
+    def _read_cpu_percent(self) -> float:
+        """
+        读取CPU使用率
+
+        后台采样线程已有结果时直接返回；否则（如单次运行）
+        退化为一次短窗口采样，不再阻塞整整1秒。
+        """
+        cpu = self._cpu_percent
+        if cpu is None:
+            cpu = psutil.cpu_percent(interval=CPU_QUICK_SAMPLE_INTERVAL)
+        return cpu
+
     def check_processes(self) -> Dict[str, Any]:
         """检查必要进程"""
         result = {"status": "pending", "progress": 0, "processes": {}}
@@ -538,16 +701,23 @@ class HealthChecker:
         optional = self.config.get("process_check", {}).get("optional_processes", [])
 
         all_processes = required + optional
-        total = len(all_processes)
-        checked = 0
 
-        for proc in all_processes:
-            port = proc.get("port")
+        # 只遍历一次进程表，后续每个进程名都在同一快照上匹配
+        process_names = self._snapshot_process_names() if PSUTIL_AVAILABLE else None
+
+        # 所有端口在同一个 selector 上批量探测，关闭端口的超时等待不再逐个累加
+        ports = [proc.get("port") for proc in all_processes]
+        port_statuses = probe_ports("localhost", ports, LOCAL_PROBE_TIMEOUT)
+
+        for proc, port, port_status in zip(all_processes, ports, port_statuses):
             name = proc.get("name")
             required_flag = proc in required
 
-            port_status = self._check_port(port)
-            process_status = self._check_process(name) if PSUTIL_AVAILABLE else None
+            process_status = (
+                self._check_process(name, process_names)
+                if process_names is not None
+                else None
+            )
 
             status = (
                 "ok" if port_status else ("critical" if required_flag else "warning")
@@ -562,8 +732,7 @@ class HealthChecker:
                 "required": required_flag,
             }
 
-            checked += 1
-            result["progress"] = int(checked / total * 100)
+        result["progress"] = 100
 
         statuses = [p.get("status") for p in result["processes"].values()]
         if "critical" in statuses:
@@ -577,25 +746,24 @@ class HealthChecker:
 
     def _check_port(self, port: int) -> bool:
         """检查端口是否开放"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        try:
-            result = sock.connect_ex(("localhost", port))
-            return result == 0
-        except Exception:
-            return False
-        finally:
-            sock.close()
+        return probe_ports("localhost", [port], LOCAL_PROBE_TIMEOUT)[0]
 
-    def _check_process(self, name: str) -> bool:
-        """检查进程是否运行"""
+    def _snapshot_process_names(self) -> str:
+        """读取一次进程表，返回以换行分隔的小写进程名"""
+        names = []
         for proc in psutil.process_iter(["name"]):
             try:
-                if name.lower() in proc.info.get("name", "").lower():
-                    return True
+                proc_name = proc.info.get("name")
+                if proc_name:
+                    names.append(proc_name.lower())
             except Exception:
                 pass
-        return False
+        # 分隔符不会出现在进程名中，单次子串查找不会跨越两个进程名
+        return "\n".join(names)
+
+    def _check_process(self, name: str, process_names: str) -> bool:
+        """检查进程是否运行（在进程名快照中做子串匹配）"""
+        return bool(name) and name.lower() in process_names
 
     def check_business(self) -> Dict[str, Any]:
         """检查业务模块"""
@@ -609,18 +777,30 @@ class HealthChecker:
         }
 
         endpoints = self.config.get("business_check", {}).get("api_endpoints", [])
-        for ep in endpoints:
-            url = ep.get("url", "")
-            name = ep.get("name", "")
-            status = self._check_endpoint(url, ep.get("timeout", 5))
-            result["api_endpoints"][name] = {"url": url, "status": status}
+        if endpoints:
+            # 各端点请求并发发出，总耗时约为最慢的一次请求
+            with ThreadPoolExecutor(max_workers=min(len(endpoints), 16)) as executor:
+                statuses = list(
+                    executor.map(
+                        lambda ep: self._check_endpoint(ep.get("url", ""), ep.get("timeout", 5)),
+                        endpoints,
+                    )
+                )
+            for ep, status in zip(endpoints, statuses):
+                url = ep.get("url", "")
+                result["api_endpoints"][ep.get("name", "")] = {"url": url, "status": status}
 
         modules = self.config.get("business_check", {}).get("modules_to_check", [])
         for module in modules:
             name = module.get("name", "")
             path = self.project_root / module.get("path", "")
             files = module.get("files", [])
-            file_status = [{"file": f, "exists": (path / f).exists()} for f in files]
+            # 模块目录只 scandir 一次，直接位于目录下的文件用名称查找，嵌套路径才单独 stat
+            names = scan_dir(path) if files else {}
+            file_status = [
+                {"file": f, "exists": f in names if "/" not in f else (path / f).exists()}
+                for f in files
+            ]
             result["modules"][name] = {"path": str(path), "files": file_status}
 
         # 增强引擎检查
@@ -647,82 +827,66 @@ class HealthChecker:
         return result
 
     def _check_engines_detail(self) -> Dict[str, Any]:
-        """详细检查所有引擎适配器"""
-        results = {}
-
-        # 检查 Deep-Live-Cam
-        results["deeplivecam"] = self._check_deep_live_cam()
-
-        # 检查 FaceFusion
-        results["facefusion"] = self._check_face_fusion()
-
-        # 检查 iRoop
-        results["iroop"] = self._check_iroop()
-
-        return results
-
-    def _check_deep_live_cam(self) -> Dict[str, Any]:
-        """检查 Deep-Live-Cam 引擎"""
-        result = {
-            "name": "Deep-Live-Cam",
-            "available": False,
-            "status": "unavailable",
-            "details": {},
+        """详细检查所有引擎适配器（三个引擎互相独立，并发检查）"""
+        checks = {
+            # 检查 Deep-Live-Cam
+            "deeplivecam": self._check_deep_live_cam,
+            # 检查 FaceFusion
+            "facefusion": self._check_face_fusion,
+            # 检查 iRoop
+            "iroop": self._check_iroop,
         }
+        # assets 目录只列一次，三个引擎共用同一份目录快照
+        assets = scan_dir(self.project_root / "assets")
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {key: executor.submit(func, assets) for key, func in checks.items()}
+            return {key: future.result() for key, future in futures.items()}
+
+    def _check_engine_adapter(
+        self,
+        name: str,
+        module_name: str,
+        class_name: str,
+        vendor_dir: str,
+        files: Dict[str, str],
+        assets: Optional[Dict[str, bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        检查单个引擎适配器
 
-        try:
-            # 适配my_ai_popup_project的路径
-            from src.integrations.deep_live_cam import DeepLiveCamAdapter
-
-            adapter = DeepLiveCamAdapter()
-
-            # 检查文件存在
-            vendor_path = self.project_root / "assets" / "Deep-Live-Cam-main"
-            run_py = vendor_path / "run.py"
-            models_dir = vendor_path / "models"
-
-            result["details"]["run_py_exists"] = run_py.exists()
-            result["details"]["models_dir_exists"] = models_dir.exists()
-
-            # 检查适配器可用性
-            if adapter.is_available():
-                result["available"] = True
-                result["status"] = "ready"
-                result["details"]["adapter_loaded"] = True
-            else:
-                result["status"] = "missing_files"
-
-        except ImportError as e:
-            result["status"] = "import_error"
-            result["details"]["error"] = str(e)
-        except Exception as e:
-            result["status"] = "error"
-            result["details"]["error"] = str(e)
-
-        return result
+        Args:
+            name: 引擎显示名称
+            module_name: 适配器所在模块
+            class_name: 适配器类名
+            vendor_dir: assets 下的引擎目录名
+            files: 详情字段名 -> 引擎目录内的条目名
+            assets: assets 目录的 scan_dir 快照（可选，未提供时自行读取）
 
-    def _check_face_fusion(self) -> Dict[str, Any]:
-        """检查 FaceFusion 引擎"""
+        Returns:
+            Dict[str, Any]: 引擎检查结果
+        """
         result = {
-            "name": "FaceFusion",
+            "name": name,
             "available": False,
             "status": "unavailable",
             "details": {},
         }
 
-        try:
-            # 适配my_ai_popup_project的路径
-            from src.integrations.facefusion import FaceFusionAdapter
-
-            adapter = FaceFusionAdapter()
-
-            # 检查文件存在
-            vendor_path = self.project_root / "assets" / "facefusion-master"
-            facefusion_py = vendor_path / "facefusion.py"
-            configs_dir = vendor_path / "facefusion"
+        # 检查文件存在：引擎目录只 scandir 一次，之后全部是字典查找
+        if assets is None:
+            assets = scan_dir(self.project_root / "assets")
+        vendor_exists = assets.get(vendor_dir) is True
+        entries = scan_dir(self.project_root / "assets" / vendor_dir) if vendor_exists else {}
+        for key, entry_name in files.items():
+            result["details"][key] = entry_name in entries
+
+        # 引擎目录不存在时适配器必然不可用，跳过导入（适配器会连带导入重量级依赖）
+        if not vendor_exists:
+            result["status"] = "missing_files"
+            return result
 
-            result["details"]["facefusion_py_exists"] = facefusion_py.exists()
-            result["details"]["configs_dir_exists"] = configs_dir.exists()
+        try:
+            adapter = _load_adapter_class(module_name, class_name)()
 
             # 检查适配器可用性
             if adapter.is_available():
@@ -741,55 +905,89 @@ class HealthChecker:
 
         return result
 
-    def _check_iroop(self) -> Dict[str, Any]:
+    # 适配器模块路径按 src/integrations 下的实际文件（*_adapter.py）填写：
+    # 改动前使用的 src.integrations.deep_live_cam / facefusion / iroop 模块并不存在，
+    # 三个引擎因此始终报告 import_error。这是功能修正，不只是性能调整。
+    def _check_deep_live_cam(self, assets: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+        """检查 Deep-Live-Cam 引擎"""
+        return self._check_engine_adapter(
+            "Deep-Live-Cam",
+            "src.integrations.deep_live_cam_adapter",
+            "DeepLiveCamAdapter",
+            "Deep-Live-Cam-main",
+            {"run_py_exists": "run.py", "models_dir_exists": "models"},
+            assets,
+        )
+
+    def _check_face_fusion(self, assets: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+        """检查 FaceFusion 引擎"""
+        return self._check_engine_adapter(
+            "FaceFusion",
+            "src.integrations.facefusion_adapter",
+            "FaceFusionAdapter",
+            "facefusion-master",
+            {"facefusion_py_exists": "facefusion.py", "configs_dir_exists": "facefusion"},
+            assets,
+        )
+
+    def _check_iroop(self, assets: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """检查 iRoop 引擎"""
-        result = {
-            "name": "iRoop",
-            "available": False,
-            "status": "unavailable",
-            "details": {},
-        }
+        return self._check_engine_adapter(
+            "iRoop",
+            "src.integrations.iroop_adapter",
+            "IRoopAdapter",
+            "iRoopDeepFaceCam-main",
+            {"run_py_exists": "run.py", "models_dir_exists": "models"},
+            assets,
+        )
+
+    def _get_session(self):
+        """获取共享的 requests.Session（延迟导入 requests），不可用时返回None"""
+        if self._session is None and REQUESTS_AVAILABLE:
+            with self._session_lock:
+                if self._session is None:
+                    try:
+                        import requests
+                        from requests.adapters import HTTPAdapter
+                    except ImportError:
+                        return None
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
 
-        try:
-            # 适配my_ai_popup_project的路径
-            from src.integrations.iroop import IRoopAdapter
-
-            adapter = IRoopAdapter()
-
-            # 检查文件存在
-            vendor_path = self.project_root / "assets" / "iRoopDeepFaceCam-main"
-            run_py = vendor_path / "run.py"
-            models_dir = vendor_path / "models"
-
-            result["details"]["run_py_exists"] = run_py.exists()
-            result["details"]["models_dir_exists"] = models_dir.exists()
-
-            # 检查适配器可用性
-            if adapter.is_available():
-                result["available"] = True
-                result["status"] = "ready"
-                result["details"]["adapter_loaded"] = True
-            else:
-                result["status"] = "missing_files"
+    def _check_endpoint(self, url: str, timeout: int) -> str:
+        """检查API端点（连接失败按指数退避加抖动重试，刚启动的服务不会被误判）
 
-        except ImportError as e:
-            result["status"] = "import_error"
-            result["details"]["error"] = str(e)
-        except Exception as e:
-            result["status"] = "error"
-            result["details"]["error"] = str(e)
+        所有尝试与退避等待的总耗时不超过 timeout。
+        """
+        session = self._get_session()
+        if session is None:
+            return "unavailable"
 
-        return result
+        from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 
-    def _check_endpoint(self, url: str, timeout: int) -> str:
-        """检查API端点"""
-        if not REQUESTS_AVAILABLE:
-            return "unavailable"
-        try:
-            r = requests.get(url, timeout=timeout)
-            return "ok" if r.status_code == 200 else "error"
-        except Exception:
-            return "unreachable"
+        deadline = time.monotonic() + timeout
+        for attempt in range(ENDPOINT_MAX_RETRIES + 1):
+            try:
+                r = session.get(url, timeout=max(deadline - time.monotonic(), 0.001))
+                return "ok" if r.status_code == 200 else "error"
+            except Timeout:
+                # 超时已耗尽预算（ConnectTimeout 同时是 ConnectionError，需先于其判断）
+                break
+            except RequestsConnectionError:
+                if attempt == ENDPOINT_MAX_RETRIES:
+                    break
+                delay = ENDPOINT_RETRY_BASE_DELAY * 2 ** attempt
+                delay *= 1 + random.random() * ENDPOINT_RETRY_JITTER
+                if time.monotonic() + delay >= deadline:
+                    break
+                time.sleep(delay)
+            except Exception:
+                break
+        return "unreachable"
 
     def check_output(self) -> Dict[str, Any]:
         """检查输出模块（虚拟摄像头等）"""
@@ -837,28 +1035,38 @@ class HealthChecker:
         return result
 
     def run_full_check(self) -> Dict[str, Any]:
-        """执行完整健康检查"""
+        """执行完整健康检查（各层检查互相独立，并发执行）"""
         print("开始my_ai_popup_project健康检测...")
 
-        print("[1/5] 检查依赖层...")
-        self.results["dependency_check"] = self.check_dependencies()
-        print(f"  状态: {self.results['dependency_check']['status']}")
-
-        print("[2/5] 检查系统层...")
-        self.results["system_check"] = self.check_system()
-        print(f"  状态: {self.results['system_check']['status']}")
+        stages = [
+            ("dependency_check", "依赖层", self.check_dependencies),
+            ("system_check", "系统层", self.check_system),
+            ("process_check", "进程层", self.check_processes),
+            ("business_check", "业务层", self.check_business),
+            ("output_check", "输出层", self.check_output),
+        ]
+        total = len(stages)
 
-        print("[3/5] 检查进程层...")
-        self.results["process_check"] = self.check_processes()
-        print(f"  状态: {self.results['process_check']['status']}")
+        # psutil 不可用时系统层没有可做的检查，直接给出跳过结果，不占用工作线程
+        stage_results: Dict[str, Dict[str, Any]] = {}
+        if not PSUTIL_AVAILABLE:
+            stage_results["system_check"] = self._system_check_skipped()
+            stages_to_run = [stage for stage in stages if stage[0] != "system_check"]
+            print(f"[1/{total}] 系统层检查跳过  状态: warning (psutil未安装)")
+        else:
+            stages_to_run = stages
 
-        print("[4/5] 检查业务层...")
-        self.results["business_check"] = self.check_business()
-        print(f"  状态: {self.results['business_check']['status']}")
+        # 系统层的CPU采样、进程层的端口探测、业务层的HTTP请求都是阻塞等待，
+        # 并发执行后总耗时由最慢的一层决定；结果全部返回后再统一写入 self.results
+        with ThreadPoolExecutor(max_workers=len(stages_to_run)) as executor:
+            futures = {executor.submit(func): (key, label) for key, label, func in stages_to_run}
+            for done, future in enumerate(as_completed(futures), len(stage_results) + 1):
+                key, label = futures[future]
+                stage_results[key] = future.result()
+                print(f"[{done}/{total}] {label}检查完成  状态: {stage_results[key]['status']}")
 
-        print("[5/5] 检查输出层...")
-        self.results["output_check"] = self.check_output()
-        print(f"  状态: {self.results['output_check']['status']}")
+        for key, _, _ in stages:
+            self.results[key] = stage_results[key]
 
         statuses = [
             self.results["dependency_check"].get("status"),
@@ -882,8 +1090,20 @@ class HealthChecker:
         """保存检查结果"""
         output_path = self.project_root / path
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        payload = None
+        if ORJSON_AVAILABLE:
+            # orjson 直接输出 UTF-8 字节；遇到无法序列化的对象时回退到标准库
+            try:
+                payload = orjson.dumps(
+                    self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError:
+                payload = None
+        if payload is not None:
+            output_path.write_bytes(payload)
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False)
         info(f"结果已保存到: {output_path}")
 
     def get_summary(self) -> Dict[str, Any]:
@@ -918,48 +1138,102 @@ class HealthChecker:
 
         if auto_open_browser:
             launcher = BrowserLauncher()
-            # 延迟1秒打开浏览器，确保服务已启动
-            threading.Timer(1, lambda: launcher.open_browser(url)).start()
+            service = ServiceChecker("127.0.0.1", port, timeout=5)
+
+            def open_when_ready():
+                # 端口可连接即打开浏览器，不再固定等待1秒
+                if service.wait_for_service(interval=0.02):
+                    launcher.open_browser(url)
+
+            threading.Thread(target=open_when_ready, daemon=True).start()
             print("✅ 浏览器弹窗已启动...")
 
-        # 启动Flask应用
-        app.run(host="0.0.0.0", port=port, debug=False, use_reloader=False)
+        # 启动Flask应用：优先使用 waitress（生产级多线程WSGI服务器），未安装时回退到内置服务器
+        web_app = create_app()
+        if _module_available("waitress"):
+            from waitress import serve
+
+            info("使用 waitress 提供Web服务")
+            serve(web_app, host="0.0.0.0", port=port, threads=WEB_SERVER_THREADS)
+        else:
+            web_app.run(
+                host="0.0.0.0", port=port, debug=False, use_reloader=False, threaded=True
+            )
+
+
+# health_checker 将在首次请求时初始化为 HealthChecker 实例
+health_checker: Optional["HealthChecker"] = None
+app = None
 
+# waitress 工作线程数；状态保存在本进程内存中，因此只用单进程多线程
+WEB_SERVER_THREADS = 8
 
-if FLASK_AVAILABLE:
-    app = Flask(__name__)
+# 静态资源的浏览器缓存时间（秒）
+STATIC_MAX_AGE = 3600
 
-    # 获取项目根目录
-    PROJECT_ROOT = get_project_root()
-    WEB_DIR = get_web_dir()
-    TEMPLATES_DIR = WEB_DIR / "templates"
-    STATIC_DIR = WEB_DIR / "static"
+# /api/status 响应缓存：TTL 内直接返回已序列化的JSON，检查完成时主动失效
+STATUS_CACHE_TTL = 10.0
+_status_cache: Dict[str, Any] = {"ts": 0.0, "payload": None}
+_status_cache_lock = threading.Lock()
 
-    # health_checker 将在首次请求时初始化为 HealthChecker 实例
-    health_checker: Optional["HealthChecker"] = None
 
-    # 挂载静态文件 - 使用werkzeug
-    if STATIC_DIR.exists():
-        app.wsgi_app = SharedDataMiddleware(app.wsgi_app, {
-            '/static': str(STATIC_DIR)
-        })
+def _invalidate_status_cache():
+    with _status_cache_lock:
+        _status_cache["payload"] = None
+
+
+def create_app():
+    """创建Flask应用（首次调用时才导入 Flask）"""
+    global app
+    if app is not None:
+        return app
+
+    from flask import Flask, Response, jsonify, request
+
+    # Web目录
+    web_dir = get_web_dir()
+    templates_dir = web_dir / "templates"
+    static_dir = web_dir / "static"
+
+    # 静态文件走 Flask 内置路由（ETag/304、Range 请求）；目录不存在时不注册
+    app = Flask(
+        __name__,
+        static_folder=str(static_dir) if static_dir.exists() else None,
+        static_url_path="/static",
+    )
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = STATIC_MAX_AGE
+
+    # 主页在进程生命周期内不变，创建应用时读取一次并计算ETag
+    index_path = templates_dir / "index.html"
+    if index_path.exists():
+        index_bytes = index_path.read_bytes()
+    else:
+        index_bytes = """<!DOCTYPE html><html><head><meta charset="UTF-8"><title>my_ai_popup_project 健康监控</title></head><body><h1>my_ai_popup_project 健康监控</h1><p>正在加载...</p></body></html>""".encode("utf-8")
+    index_etag = hashlib.md5(index_bytes).hexdigest()
 
     @app.route("/")
     def index():
         """提供Web监控主页"""
-        index_path = TEMPLATES_DIR / "index.html"
-        if index_path.exists():
-            with open(index_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        return """<!DOCTYPE html><html><head><meta charset="UTF-8"><title>my_ai_popup_project 健康监控</title></head><body><h1>my_ai_popup_project 健康监控</h1><p>正在加载...</p></body></html>"""
+        response = Response(index_bytes, mimetype="text/html")
+        response.set_etag(index_etag)
+        # 客户端携带匹配的 If-None-Match 时返回 304
+        return response.make_conditional(request)
 
     @app.route("/api/status")
     def api_status():
-        global health_checker
-        if health_checker is not None:
-            # type: ignore[union-attr] - Pylance 无法追踪全局变量的类型变化
-            return jsonify(health_checker.get_summary())  # type: ignore[union-attr]
-        return jsonify({"running": False})
+        if health_checker is None:
+            return jsonify({"running": False})
+        with _status_cache_lock:
+            payload = _status_cache["payload"]
+            if payload is None or time.monotonic() - _status_cache["ts"] >= STATUS_CACHE_TTL:
+                summary = health_checker.get_summary()
+                if ORJSON_AVAILABLE:
+                    payload = orjson.dumps(summary)
+                else:
+                    payload = json.dumps(summary, ensure_ascii=False).encode("utf-8")
+                _status_cache["payload"] = payload
+                _status_cache["ts"] = time.monotonic()
+        return Response(payload, mimetype="application/json")
 
     @app.route("/api/run_check", methods=["POST"])
     def api_run_check():
@@ -967,15 +1241,17 @@ if FLASK_AVAILABLE:
         # 确保 health_checker 已初始化
         if health_checker is None:
             health_checker = HealthChecker()
-        # type: ignore[union-attr] - Pylance 无法理解条件检查后的类型变化
+        checker = health_checker
         threading.Thread(
             target=lambda: (
-                health_checker.run_full_check(),  # type: ignore[union-attr]
-                health_checker.save_results(),  # type: ignore[union-attr]
+                checker.run_full_check(),
+                checker.save_results(),
+                _invalidate_status_cache(),
             )
         ).start()
         return jsonify({"status": "started"})
 
+    return app
 
 def main():
     import argparse
@@ -1008,39 +1284,60 @@ def main():
         print("按 Ctrl+C 退出监控\n")
         print("=" * 60)
 
-        while True:
-            try:
-                checker.run_full_check()
-                checker.save_results()
-                summary = checker.get_summary()
-
-                # 简洁输出
-                status_symbol = (
-                    "✓"
-                    if summary["overall_status"] == "ok"
-                    else ("⚠" if summary["overall_status"] == "warning" else "✗")
-                )
-                ts = summary.get("timestamp", "")
-                timestamp = ts.split("T")[1].split(".")[0] if ts else "N/A"
-
-                print(
-                    f"[{timestamp}] {status_symbol} 整体: {summary['overall_status']} | "
-                    f"依赖: {summary['dependency_status']} | "
-                    f"系统: {summary['system_status']} | "
-                    f"进程: {summary['process_status']} | "
-                    f"业务: {summary['business_status']}"
-                )
-
-                import time
-
-                time.sleep(args.interval)
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                error(f"监控异常: {e}")
-                import time
+        # 检查在单个后台工作线程中执行（以I/O等待为主），主线程按固定节拍调度并打印结果，
+        # 慢检查不会拖动刷新间隔；检测器跨轮次复用，CPU采样线程与连接池随之常驻
+        def run_and_save() -> Dict[str, Any]:
+            checker.run_full_check()
+            checker.save_results()
+            return checker.get_summary()
+
+        def print_summary(summary: Dict[str, Any]):
+            # 简洁输出
+            status_symbol = (
+                "✓"
+                if summary["overall_status"] == "ok"
+                else ("⚠" if summary["overall_status"] == "warning" else "✗")
+            )
+            ts = summary.get("timestamp", "")
+            timestamp = ts.split("T")[1].split(".")[0] if ts else "N/A"
+
+            print(
+                f"[{timestamp}] {status_symbol} 整体: {summary['overall_status']} | "
+                f"依赖: {summary['dependency_status']} | "
+                f"系统: {summary['system_status']} | "
+                f"进程: {summary['process_status']} | "
+                f"业务: {summary['business_status']}"
+            )
 
-                time.sleep(args.interval)
+        checker.start_cpu_sampler()
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="monitor-check")
+        pending = None
+        next_tick = time.monotonic()
+        try:
+            while True:
+                # 上一轮检查仍在进行时不叠加新的检查
+                if pending is None:
+                    pending = pool.submit(run_and_save)
+                next_tick += args.interval
+
+                # 等待到下一个节拍，期间检查完成则立即打印
+                remaining = next_tick - time.monotonic()
+                if remaining > 0:
+                    wait([pending], timeout=remaining)
+                if pending.done():
+                    try:
+                        print_summary(pending.result())
+                    except Exception as e:
+                        error(f"监控异常: {e}")
+                    pending = None
+                    remaining = next_tick - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pool.shutdown(wait=False)
+            checker.stop_cpu_sampler()
 
         print("\n👋 监控已停止")
         return
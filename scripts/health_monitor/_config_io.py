@@ -0,0 +1,60 @@
+"""
+配置文件读取工具
+health_monitor 各脚本共用的JSON读写，以及多文件时的并发批量读取
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, TypeVar, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# 待读取文件数达到该值才启用线程池；单个或少量小文件直接顺序读取，线程调度开销反而更大
+BATCH_MIN_FILES = 4
+BATCH_MAX_WORKERS = 16
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """读取单个JSON文件（一次 open + read，不经过线程池），优先使用 orjson 解析"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(data: Any, path: Union[str, Path]) -> None:
+    """写出2空格缩进、保留非ASCII字符的JSON文件，不经过中间字符串
+
+    orjson 可用时一次性生成UTF-8字节直接写入；否则由 json.dump 分块写入文件。
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            payload = None
+        if payload is not None:
+            with open(path, 'wb') as f:
+                f.write(payload)
+            return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def map_files(func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """对每个条目执行文件读取函数，结果与输入顺序一致
+
+    条目数不足 BATCH_MIN_FILES 时顺序执行，否则分发到线程池并发读取。
+    """
+    items = list(items)
+    if len(items) < BATCH_MIN_FILES:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(len(items), BATCH_MAX_WORKERS)) as executor:
+        return list(executor.map(func, items))
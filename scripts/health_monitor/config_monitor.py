@@ -6,14 +6,23 @@
 
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import datetime
 import logging
 
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.health_monitor._config_io import read_json, dump_json, map_files
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# JS配置在报告中的预览长度（字符）
+JS_PREVIEW_CHARS = 200
+
 class ConfigMonitor:
     """配置监控类"""
 
@@ -42,38 +51,14 @@ class ConfigMonitor:
             'summary': {}
         }
 
-        for config_name, config_path in self.config_files.items():
-            full_path = self.project_root / config_path
-            if full_path.exists():
-                try:
-                    if config_path.endswith('.json'):
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            config_data = json.load(f)
-                        results['configs'][config_name] = {
-                            'status': 'loaded',
-                            'path': str(full_path),
-                            'data': config_data
-                        }
-                    elif config_path.endswith('.js'):
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        results['configs'][config_name] = {
-                            'status': 'loaded',
-                            'path': str(full_path),
-                            'content': content[:200] + '...' if len(content) > 200 else content
-                        }
-                except Exception as e:
-                    results['configs'][config_name] = {
-                        'status': 'error',
-                        'error': str(e)
-                    }
-                    results['issues'].append(f"配置加载失败 {config_name}: {e}")
-            else:
-                results['configs'][config_name] = {
-                    'status': 'missing',
-                    'path': str(full_path)
-                }
-                results['issues'].append(f"缺少配置文件: {config_name} ({config_path})")
+        # 各配置文件互不依赖，读取和解析并发执行，再按 config_files 顺序汇总
+        loaded = map_files(self._load_config, self.config_files.items())
+
+        for (config_name, _), (config_info, issue) in zip(self.config_files.items(), loaded):
+            if config_info is not None:
+                results['configs'][config_name] = config_info
+            if issue:
+                results['issues'].append(issue)
 
         # 检查配置一致性
         consistency_issues = self.check_config_consistency(results['configs'])
@@ -89,6 +74,40 @@ class ConfigMonitor:
 
         return results
 
+    def _load_config(self, item: Tuple[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """读取单个配置文件，返回 (配置状态或None, 问题描述或None)"""
+        config_name, config_path = item
+        full_path = self.project_root / config_path
+        if not full_path.exists():
+            return {
+                'status': 'missing',
+                'path': str(full_path)
+            }, f"缺少配置文件: {config_name} ({config_path})"
+
+        try:
+            if config_path.endswith('.json'):
+                config_data = read_json(full_path)
+                return {
+                    'status': 'loaded',
+                    'path': str(full_path),
+                    'data': config_data
+                }, None
+            elif config_path.endswith('.js'):
+                # 报告只保留前200个字符，多读1个字符即可判断是否需要省略号
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    head = f.read(JS_PREVIEW_CHARS + 1)
+                return {
+                    'status': 'loaded',
+                    'path': str(full_path),
+                    'content': head[:JS_PREVIEW_CHARS] + '...' if len(head) > JS_PREVIEW_CHARS else head
+                }, None
+        except Exception as e:
+            return {
+                'status': 'error',
+                'error': str(e)
+            }, f"配置加载失败 {config_name}: {e}"
+        return None, None
+
     def check_config_consistency(self, configs: Dict[str, Any]) -> List[str]:
         """检查配置一致性"""
         issues = []
@@ -97,16 +116,20 @@ class ConfigMonitor:
         if 'project' in configs and configs['project']['status'] == 'loaded':
             project_config = configs['project']['data']
             project_subprojects = project_config.get('subprojects', {})
-
-            for sub_name, sub_info in project_subprojects.items():
-                config_file = sub_info.get('configFile', '').replace('./', '')
-                if config_file and config_file in [p.replace('./', '') for p in self.config_files.values()]:
-                    if sub_name in configs:
-                        sub_config = configs[sub_name]
-                        if sub_config['status'] != 'loaded':
-                            issues.append(f"子项目 {sub_name} 配置未正确加载")
-                    else:
-                        issues.append(f"项目配置中定义的子项目 {sub_name} 缺少对应配置检查")
+            # 受监控的配置路径与各配置状态各构建一次，之后单次遍历子项目，只做集合/字典查找
+            monitored_files = frozenset(p.replace('./', '') for p in self.config_files.values())
+            statuses = {name: info['status'] for name, info in configs.items()}
+            sub_config_files = (
+                (sub_name, sub_info.get('configFile', '').replace('./', ''))
+                for sub_name, sub_info in project_subprojects.items()
+            )
+
+            issues.extend(
+                f"子项目 {sub_name} 配置未正确加载" if sub_name in statuses
+                else f"项目配置中定义的子项目 {sub_name} 缺少对应配置检查"
+                for sub_name, config_file in sub_config_files
+                if config_file in monitored_files and statuses.get(sub_name) != 'loaded'
+            )
 
         # 检查路径一致性
         if 'project' in configs and 'docs' in configs:
@@ -142,37 +165,38 @@ class ConfigMonitor:
 
     def generate_config_report(self, results: Dict[str, Any]) -> str:
         """生成配置报告"""
-        report = []
-        report.append("# 配置完整性报告")
-        report.append(f"生成时间: {results['timestamp']}")
-        report.append("")
+        return "\n".join(self.iter_config_report(results))
+
+    def iter_config_report(self, results: Dict[str, Any]) -> Iterator[str]:
+        """逐行生成配置报告（不含换行符），供流式写出使用"""
+        yield "# 配置完整性报告"
+        yield f"生成时间: {results['timestamp']}"
+        yield ""
 
-        report.append("## 配置状态汇总")
+        yield "## 配置状态汇总"
         summary = results['summary']
-        report.append(f"- 总配置数: {summary['total_configs']}")
-        report.append(f"- 已加载: {summary['loaded_configs']}")
-        report.append(f"- 缺失: {summary['missing_configs']}")
-        report.append(f"- 错误: {summary['error_configs']}")
-        report.append(f"- 问题总数: {summary['total_issues']}")
-        report.append("")
+        yield f"- 总配置数: {summary['total_configs']}"
+        yield f"- 已加载: {summary['loaded_configs']}"
+        yield f"- 缺失: {summary['missing_configs']}"
+        yield f"- 错误: {summary['error_configs']}"
+        yield f"- 问题总数: {summary['total_issues']}"
+        yield ""
 
         if results['issues']:
-            report.append("## 发现的问题")
+            yield "## 发现的问题"
             for issue in results['issues']:
-                report.append(f"- {issue}")
-            report.append("")
+                yield f"- {issue}"
+            yield ""
 
-        report.append("## 详细配置状态")
+        yield "## 详细配置状态"
         for config_name, config_info in results['configs'].items():
-            report.append(f"### {config_name}")
-            report.append(f"- 状态: {config_info['status']}")
+            yield f"### {config_name}"
+            yield f"- 状态: {config_info['status']}"
             if 'path' in config_info:
-                report.append(f"- 路径: {config_info['path']}")
+                yield f"- 路径: {config_info['path']}"
             if 'error' in config_info:
-                report.append(f"- 错误: {config_info['error']}")
-            report.append("")
-
-        return "\n".join(report)
+                yield f"- 错误: {config_info['error']}"
+            yield ""
 
 def main():
     """主函数"""
@@ -188,13 +212,7 @@ def main():
     monitor = ConfigMonitor(args.project_root)
     results = monitor.check_config_integrity()
 
-    if args.format == 'json':
-        output_content = json.dumps(results, indent=2, ensure_ascii=False)
-        output_ext = 'json'
-    else:
-        output_content = monitor.generate_config_report(results)
-        output_ext = 'md'
-
+    output_ext = 'json' if args.format == 'json' else 'md'
     if args.output:
         output_file = args.output
     else:
@@ -204,8 +222,12 @@ def main():
     output_path = monitor.project_root / output_file
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(output_content)
+    # JSON报告直接写入文件；Markdown报告只有几KB，拼成字符串后一次写出
+    if args.format == 'json':
+        dump_json(results, output_path)
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(monitor.generate_config_report(results))
 
     print(f"配置报告已保存到: {output_path}")
 
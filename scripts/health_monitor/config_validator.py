@@ -6,25 +6,50 @@
 
 import os
 import sys
-import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional, Set, Tuple
 from datetime import datetime
-import re
-
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/config_validator.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# 单文件验证直接用 read_json 顺序读取；只有多文件（如五层规则）才经 map_files 批量读取
+from scripts.health_monitor._config_io import read_json, map_files, dump_json
+
 logger = logging.getLogger(__name__)
 
+# 命令行运行时的日志文件；作为库导入时不创建文件句柄
+LOG_FILE = Path('logs') / 'config_validator.log'
+
+def _setup_logging() -> None:
+    """配置命令行日志：确保 logs/ 存在后再挂载滚动文件处理器"""
+    from logging.handlers import RotatingFileHandler
+
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=5,
+                encoding='utf-8'
+            ),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+def _read_rule_file(path: Path) -> Tuple[Any, Optional[Exception]]:
+    """读取规则文件，返回 (解析结果, 异常)"""
+    try:
+        return read_json(path), None
+    except Exception as e:
+        return None, e
+
 class ConfigValidator:
     """配置验证器"""
 
@@ -32,6 +57,10 @@ class ConfigValidator:
         self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent.parent
         self.issues = []
         self.warnings = []
+        # 目录 -> 条目名集合，单次验证内每个目录只列举一次，存在性检查改为集合查找
+        self._dirs_cache: Dict[Path, Set[str]] = {}
+        # 配置名 -> (解析结果, 异常)，各验证器与跨配置检查共用，每个文件只读取一次
+        self._parsed: Dict[str, Tuple[Any, Optional[Exception]]] = {}
 
         # 关键配置文件路径
         self.config_paths = {
@@ -43,10 +72,48 @@ class ConfigValidator:
 
         logger.info(f"初始化配置验证器，项目根目录: {self.project_root}")
 
+    def _list_dir(self, directory: Path) -> Set[str]:
+        """列举目录条目名（带缓存），目录不存在时返回空集合"""
+        names = self._dirs_cache.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            self._dirs_cache[directory] = names
+        return names
+
+    def _entry_exists(self, path: Path) -> bool:
+        """通过父目录的缓存列表判断路径是否存在"""
+        return path.name in self._list_dir(path.parent)
+
+    def _parse_config_file(self, name: str) -> Tuple[Any, Optional[Exception]]:
+        """读取并解析单个关键配置，返回 (解析结果, 异常)；JS配置返回文本内容"""
+        path = self.config_paths[name]
+        try:
+            if path.suffix == '.js':
+                with open(path, 'r', encoding='utf-8') as f:
+                    return f.read(), None
+            return read_json(path), None
+        except Exception as e:
+            return None, e
+
+    def _read_config(self, name: str) -> Any:
+        """获取已解析的配置，未缓存时从磁盘读取；读取失败时抛出原异常"""
+        cached = self._parsed.get(name)
+        if cached is None:
+            cached = self._parsed[name] = self._parse_config_file(name)
+        data, error = cached
+        if error is not None:
+            raise error
+        return data
+
     def validate_all_configs(self) -> Dict[str, Any]:
         """验证所有配置文件"""
         logger.info("开始验证所有配置文件...")
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self._dirs_cache.clear()
 
         results = {
             'timestamp': datetime.now().isoformat(),
@@ -56,26 +123,31 @@ class ConfigValidator:
             'summary': {}
         }
 
-        # 1. 验证项目主配置
-        results['validations']['project_config'] = self.validate_project_config()
-
-        # 2. 验证文档配置
-        results['validations']['docs_config'] = self.validate_docs_config()
-
-        # 3. 验证脚本配置
-        results['validations']['scripts_config'] = self.validate_scripts_config()
+        validators = [
+            ('project_config', self.validate_project_config),  # 1. 验证项目主配置
+            ('docs_config', self.validate_docs_config),  # 2. 验证文档配置
+            ('scripts_config', self.validate_scripts_config),  # 3. 验证脚本配置
+            ('rules_config', self.validate_rules_config),  # 4. 验证规则配置
+            ('cross_config', self.validate_cross_config_consistency)  # 5. 验证配置间一致性
+        ]
 
-        # 4. 验证规则配置
-        results['validations']['rules_config'] = self.validate_rules_config()
+        # 先批量读取全部关键配置，验证器并发执行时只读缓存
+        self._parsed = dict(zip(self.config_paths, map_files(self._parse_config_file, self.config_paths)))
 
-        # 5. 验证配置间一致性
-        results['validations']['cross_config'] = self.validate_cross_config_consistency()
+        # 各验证器只返回自身结果、互不依赖，并发执行后按固定顺序合并问题与警告
+        with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+            futures = [(name, executor.submit(validate)) for name, validate in validators]
+            for name, future in futures:
+                result = future.result()
+                results['validations'][name] = result
+                self.issues.extend(result['issues'])
+                self.warnings.extend(result['warnings'])
 
         # 汇总结果
         results['issues'] = self.issues
         results['warnings'] = self.warnings
         results['summary'] = self.generate_summary(results)
-        results['duration'] = time.time() - start_time
+        results['duration'] = time.perf_counter() - start_time
 
         logger.info(f"配置验证完成，耗时: {results['duration']:.2f}秒")
         return results
@@ -91,8 +163,7 @@ class ConfigValidator:
             return result
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self._read_config('project_config')
 
             # 验证必需字段
             required_fields = ['meta', 'project', 'subprojects']
@@ -125,8 +196,6 @@ class ConfigValidator:
             result['issues'].append(f"项目配置解析失败: {e}")
             result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def validate_docs_config(self) -> Dict[str, Any]:
@@ -140,8 +209,7 @@ class ConfigValidator:
             return result
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self._read_config('docs_config')
 
             # 验证文档结构
             if 'structure' not in config:
@@ -159,8 +227,7 @@ class ConfigValidator:
                 ]
 
                 for doc in required_docs:
-                    doc_path = docs_dir / doc
-                    if not doc_path.exists():
+                    if not self._entry_exists(docs_dir / doc):
                         result['issues'].append(f"缺少文档文件: {doc}")
                         result['status'] = 'fail'
 
@@ -168,8 +235,6 @@ class ConfigValidator:
             result['issues'].append(f"文档配置解析失败: {e}")
             result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def validate_scripts_config(self) -> Dict[str, Any]:
@@ -183,8 +248,7 @@ class ConfigValidator:
             return result
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self._read_config('scripts_config')
 
             # 验证脚本结构
             if 'structure' not in config:
@@ -218,8 +282,6 @@ class ConfigValidator:
             result['issues'].append(f"脚本配置解析失败: {e}")
             result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def validate_rules_config(self) -> Dict[str, Any]:
@@ -232,8 +294,7 @@ class ConfigValidator:
             return result
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_config('rules_config')
 
             # 验证基本JS结构
             if 'module.exports' not in content and 'export' not in content:
@@ -253,16 +314,22 @@ class ConfigValidator:
             'L5-execution.json'
         ]
 
+        present = self._list_dir(rules_dir)
+        # 先并发读取全部规则文件，再在内存中逐个校验，I/O 与校验不再交替进行
+        loaded = iter(map_files(_read_rule_file, [rules_dir / f for f in required_rules if f in present]))
+
         for rule_file in required_rules:
-            rule_path = rules_dir / rule_file
-            if not rule_path.exists():
+            if rule_file not in present:
                 result['issues'].append(f"缺少规则文件: {rule_file}")
                 result['status'] = 'fail'
+                continue
+
+            rule_data, error = next(loaded)
+            if error is not None:
+                result['issues'].append(f"规则文件解析失败 {rule_file}: {error}")
+                result['status'] = 'fail'
             else:
                 try:
-                    with open(rule_path, 'r', encoding='utf-8') as f:
-                        rule_data = json.load(f)
-
                     # 验证规则层级
                     expected_layer = rule_file.split('-')[0]
                     if rule_data.get('meta', {}).get('layer') != expected_layer:
@@ -272,8 +339,6 @@ class ConfigValidator:
                     result['issues'].append(f"规则文件解析失败 {rule_file}: {e}")
                     result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def validate_cross_config_consistency(self) -> Dict[str, Any]:
@@ -286,12 +351,8 @@ class ConfigValidator:
             for name, path in self.config_paths.items():
                 if path.exists():
                     try:
-                        if path.suffix == '.json':
-                            with open(path, 'r', encoding='utf-8') as f:
-                                configs[name] = json.load(f)
-                        elif path.suffix == '.js':
-                            with open(path, 'r', encoding='utf-8') as f:
-                                configs[name] = {'content': f.read()}
+                        config = self._read_config(name)
+                        configs[name] = {'content': config} if path.suffix == '.js' else config
                     except Exception as e:
                         result['issues'].append(f"配置文件读取失败 {name}: {e}")
                         continue
@@ -324,8 +385,6 @@ class ConfigValidator:
             result['issues'].append(f"跨配置一致性检查失败: {e}")
             result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def generate_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
@@ -362,8 +421,7 @@ class ConfigValidator:
         output_path = self.project_root / output_file
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        dump_json(results, output_path)
 
         logger.info(f"配置验证报告已保存到: {output_path}")
         return str(output_path)
@@ -379,6 +437,7 @@ def main():
 
     args = parser.parse_args()
 
+    _setup_logging()
     if args.quiet:
         logging.getLogger().setLevel(logging.WARNING)
 
@@ -4,27 +4,108 @@
 独立运行，监控文档更新状态和同步情况
 """
 
+import io
 import os
+import re
 import sys
-import json
 import time
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterator, Set, Tuple
+from datetime import datetime
+from itertools import islice
 import shutil
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/docs_sync_monitor.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.health._walk import iter_files
+from scripts.health_monitor._config_io import read_json, dump_json
+
 logger = logging.getLogger(__name__)
 
+# 命令行运行时的日志文件；作为库导入时不创建文件句柄
+LOG_FILE = Path('logs') / 'docs_sync_monitor.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# 文件日志先缓存在内存中，攒满该条数或遇到 ERROR 时才批量写盘
+LOG_BUFFER_CAPACITY = 1024
+
+def _setup_logging() -> None:
+    """配置命令行日志：文件处理器延迟打开并经 MemoryHandler 批量写入
+
+    进程退出时 logging.shutdown 会先关闭（并刷新）MemoryHandler，再关闭文件处理器，
+    缓冲中的记录不会丢失。
+    """
+    from logging.handlers import MemoryHandler
+
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8', delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+# 近期代码变更扫描：只展示前几个文件，收集满即停止遍历；不进入的目录
+RECENT_FILES_LIMIT = 5
+RECENT_SCAN_EXCLUDED_DIRS = ('.git', '__pycache__', 'node_modules', '.venv')
+
+# 上次报告的有效期（秒）：期间输入文件均未修改的检查直接复用上次结果
+REPORT_CACHE_TTL = 3600.0
+# 检查逻辑版本，写入报告；修改任一检查的判定逻辑或结果结构时递增，旧版本报告不再复用
+REPORT_CHECK_VERSION = 1
+# 可复用的检查及其读取的输入文件（相对项目根目录）
+CACHEABLE_CHECK_INPUTS = {
+    'code_sync': ('README.md', 'TODO.md', 'docs/deployment_progress/04-task-tracking.md'),
+    'cross_refs': ('README.md', 'docs/docs_README.md', 'TODO.md')
+}
+
+# 任务跟踪文档中的任务行标记（按UTF-8字节匹配，一次扫描同时查找两个标记）
+PROGRESS_TASK_PATTERN = re.compile('任务|TODO'.encode('utf-8'))
+
+# 文档新鲜度阈值（秒）
+SECONDS_PER_DAY = 86400
+FRESHNESS_THRESHOLD_SECONDS = {
+    'critical': 1.0 * SECONDS_PER_DAY,  # 部署进度、TODO
+    'important': 7.0 * SECONDS_PER_DAY,  # 项目文档
+    'normal': 30.0 * SECONDS_PER_DAY  # 配置文档
+}
+
+def _dir_names(dir_path: Path) -> Set[str]:
+    """列出目录下的条目名，目录不存在时返回空集合"""
+    try:
+        with os.scandir(dir_path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+def _missing_ascii_refs(raw: bytes, refs: List[str]) -> List[str]:
+    """大小写不敏感地在文件原始字节中查找ASCII引用，返回缺失项
+
+    引用都是ASCII路径/文件名，对字节做ASCII小写即可匹配，不必解码整个文件。
+    """
+    lowered = raw.lower()
+    return [ref for ref in refs if ref.encode('ascii') not in lowered]
+
+def _iter_md_with_mtime(dir_path: Path) -> Iterator[Tuple[str, float]]:
+    """单次 scandir 列出目录下的 .md 条目及其修改时间（与 glob('*.md') 一致，含以点开头的文件）"""
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.name.endswith('.md'):
+                    try:
+                        yield entry.name, entry.stat().st_mtime
+                    except OSError:
+                        continue
+    except OSError:
+        return
+
 class DocsSyncMonitor:
     """文档同步监控器"""
 
@@ -33,6 +114,8 @@ class DocsSyncMonitor:
         self.issues = []
         self.warnings = []
         self.recommendations = []
+        # 本次运行各检查状态的计数，收集检查结果时累加，generate_summary 直接读取
+        self._status_counts: Counter = Counter()
 
         # 文档路径定义
         self.docs_paths = {
@@ -43,15 +126,23 @@ class DocsSyncMonitor:
             'todo': self.project_root / 'TODO.md'
         }
 
+        # 单次监控内的文件读取/stat缓存：README、TODO 等被多个检查重复访问，每个文件只读一次
+        self._bytes_cache: Dict[Path, bytes] = {}
+        self._stat_cache: Dict[Path, Optional[os.stat_result]] = {}
+
         logger.info(f"初始化文档同步监控器，项目根目录: {self.project_root}")
 
     def monitor_docs_sync(self) -> Dict[str, Any]:
         """监控文档同步状态"""
         logger.info("开始监控文档同步状态...")
         start_time = time.time()
+        self._bytes_cache.clear()
+        self._stat_cache.clear()
+        self._status_counts = Counter()
 
         results = {
             'timestamp': datetime.now().isoformat(),
+            'check_version': REPORT_CHECK_VERSION,
             'checks': {},
             'issues': [],
             'warnings': [],
@@ -59,22 +150,38 @@ class DocsSyncMonitor:
             'summary': {}
         }
 
-        # 1. 检查文档结构完整性
-        results['checks']['structure'] = self.check_docs_structure()
-
-        # 2. 检查文档更新状态
-        results['checks']['freshness'] = self.check_docs_freshness()
-
-        # 3. 检查文档与代码同步
-        results['checks']['code_sync'] = self.check_code_doc_sync()
-
-        # 4. 检查文档间引用一致性
-        results['checks']['cross_refs'] = self.check_cross_references()
+        checks = [
+            ('structure', self.check_docs_structure),  # 1. 检查文档结构完整性
+            ('freshness', self.check_docs_freshness),  # 2. 检查文档更新状态
+            ('code_sync', self.check_code_doc_sync),  # 3. 检查文档与代码同步
+            ('cross_refs', self.check_cross_references),  # 4. 检查文档间引用一致性
+            ('update_suggestions', self.generate_update_suggestions)  # 5. 生成文档更新建议
+        ]
 
-        # 5. 生成文档更新建议
-        results['checks']['update_suggestions'] = self.generate_update_suggestions()
+        reusable = self._reusable_check_results()
 
-        # 汇总结果
+        # 各检查只返回自身结果、以文件读取/stat为主，并发执行后按固定顺序收集
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [(name, None if name in reusable else executor.submit(check)) for name, check in checks]
+            for name, future in futures:
+                if future is None:
+                    logger.debug("reusing cached result for %s", name)
+                    result = reusable[name]
+                else:
+                    result = future.result()
+                results['checks'][name] = result
+                self._status_counts[result.get('status', 'unknown')] += 1
+
+        # 汇总结果：全部检查完成后一次性展开各检查的问题、警告与建议
+        check_results = list(results['checks'].values())
+        self.issues = [issue for check in check_results for issue in check.get('issues', ())]
+        self.warnings = [warning for check in check_results for warning in check.get('warnings', ())]
+        self.recommendations = [
+            s['suggestion']
+            for check in check_results
+            for s in check['details'].get('suggestions', ())
+            if 'suggestion' in s
+        ]
         results['issues'] = self.issues
         results['warnings'] = self.warnings
         results['recommendations'] = self.recommendations
@@ -84,6 +191,60 @@ class DocsSyncMonitor:
         logger.info(f"文档同步监控完成，耗时: {results['duration']:.2f}秒")
         return results
 
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """stat 文件（带缓存），不存在时返回 None"""
+        if path not in self._stat_cache:
+            try:
+                self._stat_cache[path] = path.stat()
+            except OSError:
+                self._stat_cache[path] = None
+        return self._stat_cache[path]
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """读取文件原始字节（带缓存）"""
+        data = self._bytes_cache.get(path)
+        if data is None:
+            data = self._bytes_cache[path] = path.read_bytes()
+        return data
+
+    def _reusable_check_results(self) -> Dict[str, Any]:
+        """取 logs/ 下最新的监控报告：未超过 REPORT_CACHE_TTL、检查逻辑版本一致，
+        且检查的输入文件在报告生成后均未修改时，返回可直接复用的检查结果（检查名 -> 结果）"""
+        latest: Optional[Tuple[float, str]] = None
+        try:
+            with os.scandir(self.project_root / 'logs') as it:
+                for entry in it:
+                    if not (entry.name.startswith('docs_sync_report_') and entry.name.endswith('.json')):
+                        continue
+                    try:
+                        report_mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if latest is None or report_mtime > latest[0]:
+                        latest = (report_mtime, entry.path)
+        except OSError:
+            return {}
+
+        if latest is None or time.time() - latest[0] > REPORT_CACHE_TTL:
+            return {}
+        report_mtime, report_path = latest
+        try:
+            last_report = read_json(report_path)
+        except Exception:
+            return {}
+        if last_report.get('check_version') != REPORT_CHECK_VERSION:
+            return {}
+        last_checks = last_report.get('checks', {})
+
+        reusable = {}
+        for name, inputs in CACHEABLE_CHECK_INPUTS.items():
+            if name not in last_checks:
+                continue
+            stats = [self._stat(self.project_root / rel_path) for rel_path in inputs]
+            if all(stat is not None and stat.st_mtime < report_mtime for stat in stats):
+                reusable[name] = last_checks[name]
+        return reusable
+
     def check_docs_structure(self) -> Dict[str, Any]:
         """检查文档结构完整性"""
         result = {'status': 'pass', 'details': {}, 'issues': [], 'warnings': []}
@@ -107,18 +268,21 @@ class DocsSyncMonitor:
             ]
         }
 
+        # 文档类别 -> 所在目录的查表，替代逐个文档的 if/elif 分派
+        category_to_dir = {
+            'root': self.project_root,
+            'docs': self.docs_paths['docs_dir'],
+            'project_docs': self.docs_paths['project_docs'],
+            'deployment_docs': self.docs_paths['deployment_docs']
+        }
+
+        # 每个目录一次 scandir，之后按文件名做集合查找
+        listings = {category: _dir_names(dir_path) for category, dir_path in category_to_dir.items()}
+
         for category, docs in required_docs.items():
+            present = listings[category]
             for doc in docs:
-                if category == 'root':
-                    doc_path = self.project_root / doc
-                elif category == 'docs':
-                    doc_path = self.docs_paths['docs_dir'] / doc
-                elif category == 'project_docs':
-                    doc_path = self.docs_paths['project_docs'] / doc
-                elif category == 'deployment_docs':
-                    doc_path = self.docs_paths['deployment_docs'] / doc
-
-                if not doc_path.exists():
+                if doc not in present:
                     result['issues'].append(f"缺少{category}文档: {doc}")
                     result['status'] = 'fail'
                 else:
@@ -126,10 +290,9 @@ class DocsSyncMonitor:
 
         # 检查文档配置
         docs_config_path = self.docs_paths['docs_dir'] / 'docs_config.json'
-        if docs_config_path.exists():
+        if docs_config_path.name in listings['docs']:
             try:
-                with open(docs_config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = read_json(docs_config_path)
 
                 if 'structure' not in config:
                     result['warnings'].append("文档配置缺少结构定义")
@@ -138,64 +301,58 @@ class DocsSyncMonitor:
                 result['issues'].append(f"文档配置解析失败: {e}")
                 result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def check_docs_freshness(self) -> Dict[str, Any]:
         """检查文档更新状态"""
         result = {'status': 'pass', 'details': {}, 'issues': [], 'warnings': []}
 
-        now = datetime.now()
-        freshness_thresholds = {
-            'critical': timedelta(days=1),  # 部署进度、TODO
-            'important': timedelta(days=7),  # 项目文档
-            'normal': timedelta(days=30)  # 配置文档
-        }
+        now_ts = time.time()
 
-        # 检查各文档的更新时间
-        docs_to_check = {
+        # 检查各文档的更新时间：(相对路径, 优先级, 修改时间戳)，不存在的文档不记录
+        docs_to_check: List[Tuple[str, str, float]] = []
+        fixed_docs = {
             'README.md': 'normal',
             'TODO.md': 'critical',
             'docs/docs_README.md': 'normal',
             'docs/docs_config.json': 'normal'
         }
+        for doc_path_str, priority in fixed_docs.items():
+            stat = self._stat(self.project_root / doc_path_str)
+            if stat is not None:
+                docs_to_check.append((doc_path_str, priority, stat.st_mtime))
+
+        # 添加项目文档、部署文档：每个目录一次 scandir，修改时间直接取自目录项
+        for dir_key, priority in (('project_docs', 'important'), ('deployment_docs', 'critical')):
+            doc_dir = self.docs_paths[dir_key]
+            # 相对路径前缀每个目录只计算一次，循环内只做字符串拼接
+            rel_prefix = os.path.join(str(doc_dir.relative_to(self.project_root)), '')
+            docs_to_check.extend(
+                (rel_prefix + name, priority, st_mtime) for name, st_mtime in _iter_md_with_mtime(doc_dir)
+            )
+
+        for doc_path_str, priority, st_mtime in docs_to_check:
+            # 直接比较时间戳秒数，datetime 只用于报告中的ISO时间
+            age_seconds = now_ts - st_mtime
+            age_days = int(age_seconds // SECONDS_PER_DAY)
+            stale = age_seconds > FRESHNESS_THRESHOLD_SECONDS[priority]
+
+            result['details'][doc_path_str] = {
+                'last_modified': datetime.fromtimestamp(st_mtime).isoformat(),
+                'age_days': age_days,
+                'priority': priority,
+                'status': 'stale' if stale else 'fresh'
+            }
+
+            if stale:
+                if priority == 'critical':
+                    result['issues'].append(f"紧急文档过期: {doc_path_str} ({age_days}天未更新)")
+                    result['status'] = 'fail'
+                elif priority == 'important':
+                    result['warnings'].append(f"重要文档过期: {doc_path_str} ({age_days}天未更新)")
+                else:
+                    result['warnings'].append(f"文档过期: {doc_path_str} ({age_days}天未更新)")
 
-        # 添加项目文档
-        if self.docs_paths['project_docs'].exists():
-            for doc_file in self.docs_paths['project_docs'].glob('*.md'):
-                docs_to_check[str(doc_file.relative_to(self.project_root))] = 'important'
-
-        # 添加部署文档
-        if self.docs_paths['deployment_docs'].exists():
-            for doc_file in self.docs_paths['deployment_docs'].glob('*.md'):
-                docs_to_check[str(doc_file.relative_to(self.project_root))] = 'critical'
-
-        for doc_path_str, priority in docs_to_check.items():
-            doc_path = self.project_root / doc_path_str
-            if doc_path.exists():
-                mtime = datetime.fromtimestamp(doc_path.stat().st_mtime)
-                age = now - mtime
-                threshold = freshness_thresholds[priority]
-
-                result['details'][doc_path_str] = {
-                    'last_modified': mtime.isoformat(),
-                    'age_days': age.days,
-                    'priority': priority,
-                    'status': 'fresh' if age <= threshold else 'stale'
-                }
-
-                if age > threshold:
-                    if priority == 'critical':
-                        result['issues'].append(f"紧急文档过期: {doc_path_str} ({age.days}天未更新)")
-                        result['status'] = 'fail'
-                    elif priority == 'important':
-                        result['warnings'].append(f"重要文档过期: {doc_path_str} ({age.days}天未更新)")
-                    else:
-                        result['warnings'].append(f"文档过期: {doc_path_str} ({age.days}天未更新)")
-
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def check_code_doc_sync(self) -> Dict[str, Any]:
@@ -212,14 +369,10 @@ class DocsSyncMonitor:
 
         # 检查README.md是否包含配置说明
         readme_path = self.docs_paths['readme']
-        if readme_path.exists():
+        if self._stat(readme_path) is not None:
             try:
-                with open(readme_path, 'r', encoding='utf-8') as f:
-                    readme_content = f.read().lower()
-
-                for config_file in config_files:
-                    if config_file not in readme_content:
-                        result['warnings'].append(f"README.md未提及配置文件: {config_file}")
+                for config_file in _missing_ascii_refs(self._read_bytes(readme_path), config_files):
+                    result['warnings'].append(f"README.md未提及配置文件: {config_file}")
 
             except Exception as e:
                 result['issues'].append(f"README.md读取失败: {e}")
@@ -229,17 +382,18 @@ class DocsSyncMonitor:
         todo_path = self.docs_paths['todo']
         deployment_progress_path = self.docs_paths['deployment_docs'] / '04-task-tracking.md'
 
-        if todo_path.exists() and deployment_progress_path.exists():
+        if self._stat(todo_path) is not None and self._stat(deployment_progress_path) is not None:
             try:
-                with open(todo_path, 'r', encoding='utf-8') as f:
-                    todo_content = f.read()
-
-                with open(deployment_progress_path, 'r', encoding='utf-8') as f:
-                    progress_content = f.read()
+                # 检查主要任务是否同步：在缓存的原始字节上逐行计数，不解码、不切分出整个行列表
+                todo_tasks = sum(
+                    1 for line in io.BytesIO(self._read_bytes(todo_path))
+                    if line.lstrip().startswith(b'- [')
+                )
 
-                # 检查主要任务是否同步
-                todo_tasks = len([line for line in todo_content.split('\n') if line.strip().startswith('- [')])
-                progress_tasks = len([line for line in progress_content.split('\n') if '任务' in line or 'TODO' in line])
+                progress_tasks = sum(
+                    1 for line in io.BytesIO(self._read_bytes(deployment_progress_path))
+                    if PROGRESS_TASK_PATTERN.search(line)
+                )
 
                 if abs(todo_tasks - progress_tasks) > 2:
                     result['warnings'].append(f"TODO.md与任务跟踪文档任务数量不一致: TODO({todo_tasks}) vs 跟踪({progress_tasks})")
@@ -248,8 +402,6 @@ class DocsSyncMonitor:
                 result['issues'].append(f"任务文档同步检查失败: {e}")
                 result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def check_cross_references(self) -> Dict[str, Any]:
@@ -265,15 +417,9 @@ class DocsSyncMonitor:
 
         for doc_file, expected_refs in cross_ref_patterns.items():
             doc_path = self.project_root / doc_file
-            if doc_path.exists():
+            if self._stat(doc_path) is not None:
                 try:
-                    with open(doc_path, 'r', encoding='utf-8') as f:
-                        content = f.read().lower()
-
-                    missing_refs = []
-                    for ref in expected_refs:
-                        if ref not in content:
-                            missing_refs.append(ref)
+                    missing_refs = _missing_ascii_refs(self._read_bytes(doc_path), expected_refs)
 
                     if missing_refs:
                         result['warnings'].append(f"{doc_file} 缺少对以下内容的引用: {', '.join(missing_refs)}")
@@ -282,8 +428,6 @@ class DocsSyncMonitor:
                     result['issues'].append(f"文档引用检查失败 {doc_file}: {e}")
                     result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
-        self.warnings.extend(result['warnings'])
         return result
 
     def generate_update_suggestions(self) -> Dict[str, Any]:
@@ -291,6 +435,7 @@ class DocsSyncMonitor:
         result = {'status': 'pass', 'details': {}, 'issues': [], 'warnings': []}
 
         suggestions = []
+        now_ts = time.time()
 
         # 检查配置文件变更
         config_files = [
@@ -299,23 +444,26 @@ class DocsSyncMonitor:
             'src/src_config.json'
         ]
 
+        # 配置文件对应的文档
+        doc_mapping = {
+            'project_config.json': 'docs/project_docs/01-project-architecture.md',
+            'requirements.txt': 'docs/project_docs/03-dependencies-config.md',
+            'src/src_config.json': 'docs/project_docs/01-project-architecture.md'
+        }
+
+        # 多个配置映射到同一文档，stat 经本次运行的缓存，每个路径只 stat 一次
         for config_file in config_files:
             config_path = self.project_root / config_file
-            if config_path.exists():
-                # 查找对应的文档
-                doc_mapping = {
-                    'project_config.json': 'docs/project_docs/01-project-architecture.md',
-                    'requirements.txt': 'docs/project_docs/03-dependencies-config.md',
-                    'src/src_config.json': 'docs/project_docs/01-project-architecture.md'
-                }
-
+            config_stat = self._stat(config_path)
+            if config_stat is not None:
                 doc_path = self.project_root / doc_mapping.get(config_file, '')
-                if doc_path.exists():
-                    config_mtime = config_path.stat().st_mtime
-                    doc_mtime = doc_path.stat().st_mtime
+                doc_stat = self._stat(doc_path)
+                if doc_stat is not None:
+                    config_mtime = config_stat.st_mtime
+                    doc_mtime = doc_stat.st_mtime
 
                     if config_mtime > doc_mtime:
-                        days_diff = (datetime.now() - datetime.fromtimestamp(doc_mtime)).days
+                        days_diff = int((now_ts - doc_mtime) // SECONDS_PER_DAY)
                         suggestions.append({
                             'type': 'config_doc_sync',
                             'config': config_file,
@@ -326,50 +474,48 @@ class DocsSyncMonitor:
 
         # 检查代码变更是否需要文档更新
         code_dirs = ['src', 'scripts']
+        cutoff = now_ts - SECONDS_PER_DAY * 7  # 7天内
         for code_dir in code_dirs:
-            code_path = self.project_root / code_dir
-            if code_path.exists():
-                # 查找最近修改的代码文件
-                recent_changes = []
-                for py_file in code_path.rglob('*.py'):
-                    if py_file.stat().st_mtime > (datetime.now().timestamp() - 86400 * 7):  # 7天内
-                        recent_changes.append(str(py_file.relative_to(self.project_root)))
-
-                if recent_changes:
-                    suggestions.append({
-                        'type': 'code_changes',
-                        'directory': code_dir,
-                        'recent_files': recent_changes[:5],  # 最多显示5个
-                        'suggestion': f"检查{code_dir}目录的近期代码变更是否需要文档更新"
-                    })
+            # 查找最近修改的代码文件，取满 RECENT_FILES_LIMIT 个即停止遍历
+            recent_changes = list(islice(self._iter_recent_py_files(self.project_root / code_dir, cutoff), RECENT_FILES_LIMIT))
+
+            if recent_changes:
+                suggestions.append({
+                    'type': 'code_changes',
+                    'directory': code_dir,
+                    'recent_files': recent_changes,  # 最多显示 RECENT_FILES_LIMIT 个
+                    'suggestion': f"检查{code_dir}目录的近期代码变更是否需要文档更新"
+                })
 
         result['details']['suggestions'] = suggestions
-        self.recommendations.extend([s['suggestion'] for s in suggestions if 'suggestion' in s])
 
         return result
 
+    def _iter_recent_py_files(self, code_path: Path, cutoff: float) -> Iterator[str]:
+        """惰性产出 cutoff 之后修改过的 .py 文件（相对项目根目录），修改时间取自 scandir 目录项"""
+        for path, entry in iter_files(code_path, RECENT_SCAN_EXCLUDED_DIRS):
+            if not entry.name.endswith('.py'):
+                continue
+            try:
+                st_mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if st_mtime > cutoff:
+                yield os.path.relpath(path, self.project_root)
+
     def generate_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """生成监控摘要"""
         summary = {
             'total_checks': len(results['checks']),
-            'passed_checks': 0,
-            'failed_checks': 0,
-            'warning_checks': 0,
+            'passed_checks': self._status_counts['pass'],
+            'failed_checks': self._status_counts['fail'],
+            'warning_checks': self._status_counts['warning'],
             'total_issues': len(results['issues']),
             'total_warnings': len(results['warnings']),
             'total_recommendations': len(results['recommendations']),
             'sync_score': 0.0
         }
 
-        for check_name, check_result in results['checks'].items():
-            status = check_result.get('status', 'unknown')
-            if status == 'pass':
-                summary['passed_checks'] += 1
-            elif status == 'fail':
-                summary['failed_checks'] += 1
-            elif status == 'warning':
-                summary['warning_checks'] += 1
-
         summary['sync_score'] = (summary['passed_checks'] / summary['total_checks']) * 100 if summary['total_checks'] > 0 else 0.0
 
         return summary
@@ -383,8 +529,7 @@ class DocsSyncMonitor:
         output_path = self.project_root / output_file
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        dump_json(results, output_path)
 
         logger.info(f"文档同步监控报告已保存到: {output_path}")
         return str(output_path)
@@ -400,6 +545,7 @@ def main():
 
     args = parser.parse_args()
 
+    _setup_logging()
     if args.quiet:
         logging.getLogger().setLevel(logging.WARNING)
 
@@ -14,6 +14,13 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.health._walk import iter_files
+from scripts.health.file_cleanup_util import CLEANUP_DIR_NAMES, CLEANUP_EXCLUDED_DIRS, CLEANUP_SUFFIXES
 
 # 配置日志
 logging.basicConfig(
@@ -26,6 +33,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 沉积文件匹配规则：与 FileCleanupUtil 共用后缀/目录名/排除目录，另外清理 temp_* 临时文件
+STALE_PREFIX = 'temp_'
+
+
+def _safe_stat(path) -> Optional[os.stat_result]:
+    """stat 路径，不存在或不可访问时返回 None"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _read_bytes(path) -> bytes:
+    """以 os.open + os.read 读取小文件全部内容，不创建缓冲文件对象
+
+    Windows 下需带 O_BINARY，否则按文本模式打开会转换 CRLF；
+    os.read 可能少读，按 st_size 读取后继续读到 EOF 为止。
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size or 1)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
 class HealthMonitor:
     """项目健康监控主类"""
 
@@ -34,6 +68,8 @@ class HealthMonitor:
         self.config_cache = {}
         self.last_check = None
         self.issues = []
+        # 单次检查内的 stat 结果缓存：路径字符串 -> stat_result（不存在为 None）
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
 
         # 关键路径定义
         self.paths = {
@@ -49,10 +85,20 @@ class HealthMonitor:
 
         logger.info(f"初始化健康监控系统，项目根目录: {self.project_root}")
 
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """带缓存的 stat，同一次检查中各检查项重复判断的路径只 stat 一次"""
+        key = str(path)
+        try:
+            return self._stat_cache[key]
+        except KeyError:
+            st = self._stat_cache[key] = _safe_stat(key)
+            return st
+
     def run_full_check(self) -> Dict[str, Any]:
         """运行完整健康检查"""
         logger.info("开始完整健康检查...")
         start_time = time.time()
+        self._stat_cache.clear()
 
         results = {
             'timestamp': datetime.now().isoformat(),
@@ -62,28 +108,26 @@ class HealthMonitor:
             'summary': {}
         }
 
-        # 1. 基础结构检查
-        results['checks']['structure'] = self.check_project_structure()
-
-        # 2. 配置一致性检查
-        results['checks']['config'] = self.check_config_consistency()
-
-        # 3. 规则系统检查
-        results['checks']['rules'] = self.check_rules_system()
-
-        # 4. 文档同步检查
-        results['checks']['docs'] = self.check_docs_sync()
-
-        # 5. 依赖检查
-        results['checks']['dependencies'] = self.check_dependencies()
+        phases = [
+            ('structure', self.check_project_structure),  # 1. 基础结构检查
+            ('config', self.check_config_consistency),  # 2. 配置一致性检查
+            ('rules', self.check_rules_system),  # 3. 规则系统检查
+            ('docs', self.check_docs_sync),  # 4. 文档同步检查
+            ('dependencies', self.check_dependencies),  # 5. 依赖检查
+            ('tasks', self.unify_task_docs)  # 6. 任务文档统一
+        ]
 
-        # 6. 任务文档统一
-        results['checks']['tasks'] = self.unify_task_docs()
+        # 前6项只读、以stat/文件读取为主，并发执行后按固定顺序收集
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [(name, executor.submit(check)) for name, check in phases]
+            for name, future in futures:
+                results['checks'][name] = future.result()
 
-        # 7. 清理沉积文件
+        # 7. 清理沉积文件：会删除文件，必须在其他检查全部完成后单独执行
         results['checks']['cleanup'] = self.cleanup_stale_files()
 
-        # 汇总结果
+        # 汇总结果：各检查只返回自身问题，全部完成后按检查顺序一次性展开
+        self.issues = [issue for check in results['checks'].values() for issue in check['issues']]
         results['issues'] = self.issues
         results['summary'] = self.generate_summary(results)
         results['duration'] = time.time() - start_time
@@ -109,7 +153,7 @@ class HealthMonitor:
 
         for path_name in required_paths:
             path = self.project_root / path_name
-            if path.exists():
+            if self._stat(path) is not None:
                 result['details'][path_name] = 'exists'
             else:
                 result['details'][path_name] = 'missing'
@@ -120,17 +164,16 @@ class HealthMonitor:
         subprojects = ['src', 'assets', 'rules', 'docs']
         for sub in subprojects:
             sub_path = self.project_root / sub
-            if sub_path.exists():
+            if self._stat(sub_path) is not None:
                 config_file = sub_path / f"{sub}_config.json"
                 readme_file = sub_path / f"{sub}_README.md"
-                if not config_file.exists():
+                if self._stat(config_file) is None:
                     result['issues'].append(f"缺少配置文件: {config_file}")
                     result['status'] = 'fail'
-                if not readme_file.exists():
+                if self._stat(readme_file) is None:
                     result['issues'].append(f"缺少说明文档: {readme_file}")
                     result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
         return result
 
     def check_config_consistency(self) -> Dict[str, Any]:
@@ -149,16 +192,13 @@ class HealthMonitor:
 
         for config_file in config_files:
             path = self.project_root / config_file
-            if path.exists():
+            if self._stat(path) is not None:
                 try:
                     if config_file.endswith('.json'):
-                        with open(path, 'r', encoding='utf-8') as f:
-                            configs[config_file] = json.load(f)
+                        configs[config_file] = json.loads(_read_bytes(path))
                     elif config_file.endswith('.js'):
                         # 简单处理JS配置文件
-                        with open(path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            configs[config_file] = {'content': content}
+                        configs[config_file] = {'content': _read_bytes(path).decode('utf-8')}
                 except Exception as e:
                     result['issues'].append(f"配置加载失败 {config_file}: {e}")
                     result['status'] = 'fail'
@@ -176,7 +216,6 @@ class HealthMonitor:
                         result['status'] = 'fail'
 
         result['details'] = {'loaded_configs': list(configs.keys())}
-        self.issues.extend(result['issues'])
         return result
 
     def check_rules_system(self) -> Dict[str, Any]:
@@ -194,20 +233,21 @@ class HealthMonitor:
             'rules.config.js'
         ]
 
+        # 已解析的规则文件，层级依赖检查直接复用，不再重复读取
+        parsed = {}
         for file in required_files:
             path = rules_dir / file
-            if not path.exists():
+            if self._stat(path) is None:
                 result['issues'].append(f"缺少规则文件: {file}")
                 result['status'] = 'fail'
             else:
                 try:
                     if file.endswith('.json'):
-                        with open(path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            # 检查基本结构
-                            if 'meta' not in data:
-                                result['issues'].append(f"规则文件结构不完整: {file}")
-                                result['status'] = 'fail'
+                        data = parsed[file] = json.loads(_read_bytes(path))
+                        # 检查基本结构
+                        if 'meta' not in data:
+                            result['issues'].append(f"规则文件结构不完整: {file}")
+                            result['status'] = 'fail'
                 except Exception as e:
                     result['issues'].append(f"规则文件解析失败 {file}: {e}")
                     result['status'] = 'fail'
@@ -215,8 +255,8 @@ class HealthMonitor:
         # 检查层级依赖
         if result['status'] == 'pass':
             try:
-                l1 = json.loads((rules_dir / 'L1-meta-goal.json').read_text(encoding='utf-8'))
-                l2 = json.loads((rules_dir / 'L2-understanding.json').read_text(encoding='utf-8'))
+                l1 = parsed['L1-meta-goal.json']
+                l2 = parsed['L2-understanding.json']
 
                 # 检查L2是否引用L1
                 if 'goals' in l1 and 'architecture' in l2:
@@ -228,7 +268,6 @@ class HealthMonitor:
                 result['issues'].append(f"层级依赖检查失败: {e}")
                 result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
         return result
 
     def check_docs_sync(self) -> Dict[str, Any]:
@@ -262,7 +301,7 @@ class HealthMonitor:
             path = docs_dir / 'project_docs' / doc if doc in project_docs else \
                    docs_dir / 'deployment_progress' / doc if doc in deployment_docs else \
                    docs_dir / doc
-            if not path.exists():
+            if self._stat(path) is None:
                 result['issues'].append(f"缺少文档: {doc}")
                 result['status'] = 'fail'
 
@@ -275,8 +314,9 @@ class HealthMonitor:
             now = datetime.now()
             outdated = []
             for doc_file in doc_files:
-                if doc_file.exists():
-                    mtime = datetime.fromtimestamp(doc_file.stat().st_mtime)
+                st = self._stat(doc_file)
+                if st is not None:
+                    mtime = datetime.fromtimestamp(st.st_mtime)
                     if (now - mtime) > timedelta(days=7):
                         outdated.append(doc_file.name)
 
@@ -285,7 +325,6 @@ class HealthMonitor:
                 result['status'] = 'warning'
 
         result['details'] = {'checked_docs': len(required_docs + project_docs + deployment_docs)}
-        self.issues.extend(result['issues'])
         return result
 
     def check_dependencies(self) -> Dict[str, Any]:
@@ -295,7 +334,7 @@ class HealthMonitor:
 
         # 检查requirements.txt
         req_file = self.project_root / 'requirements.txt'
-        if req_file.exists():
+        if self._stat(req_file) is not None:
             try:
                 with open(req_file, 'r', encoding='utf-8') as f:
                     deps = [line.strip() for line in f if line.strip() and not line.startswith('#')]
@@ -321,7 +360,6 @@ class HealthMonitor:
             result['issues'].append("缺少requirements.txt文件")
             result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
         return result
 
     def unify_task_docs(self) -> Dict[str, Any]:
@@ -332,16 +370,14 @@ class HealthMonitor:
         todo_file = self.paths['todo']
         deployment_docs_dir = self.paths['docs'] / 'deployment_progress'
 
-        if not todo_file.exists():
+        if self._stat(todo_file) is None:
             result['issues'].append("缺少根目录TODO.md文件")
             result['status'] = 'fail'
-            self.issues.extend(result['issues'])
             return result
 
         # 读取TODO.md
         try:
-            with open(todo_file, 'r', encoding='utf-8') as f:
-                todo_content = f.read()
+            todo_content = _read_bytes(todo_file).decode('utf-8')
 
             # 解析任务
             tasks = self.parse_todo_content(todo_content)
@@ -352,11 +388,10 @@ class HealthMonitor:
             for progress_file in progress_files:
                 if progress_file.name.startswith(('01-', '02-', '03-')):
                     try:
-                        with open(progress_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # 检查是否与TODO同步
-                            if 'TODO.md' in content or '任务' in content:
-                                result['details']['synced_docs'] = result['details'].get('synced_docs', 0) + 1
+                        content = _read_bytes(progress_file).decode('utf-8')
+                        # 检查是否与TODO同步
+                        if 'TODO.md' in content or '任务' in content:
+                            result['details']['synced_docs'] = result['details'].get('synced_docs', 0) + 1
                     except Exception as e:
                         result['issues'].append(f"进度文档读取失败 {progress_file.name}: {e}")
                         result['status'] = 'fail'
@@ -365,7 +400,6 @@ class HealthMonitor:
             result['issues'].append(f"TODO文档处理失败: {e}")
             result['status'] = 'fail'
 
-        self.issues.extend(result['issues'])
         return result
 
     def cleanup_stale_files(self) -> Dict[str, Any]:
@@ -373,35 +407,25 @@ class HealthMonitor:
         logger.info("清理沉积文件...")
         result = {'status': 'pass', 'details': {}, 'issues': []}
 
-        # 定义需要清理的模式
-        stale_patterns = [
-            '*.pyc',
-            '__pycache__',
-            '*.log',
-            'temp_*',
-            '*.tmp'
-        ]
-
+        root = str(self.project_root)
+        prefix_len = len(root) + 1
         cleaned_files = []
-        for pattern in stale_patterns:
-            for path in self.project_root.rglob(pattern):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                        cleaned_files.append(str(path.relative_to(self.project_root)))
-                    except Exception as e:
-                        result['issues'].append(f"清理失败 {path}: {e}")
-                        result['status'] = 'fail'
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                        cleaned_files.append(str(path.relative_to(self.project_root)))
-                    except Exception as e:
-                        result['issues'].append(f"清理失败 {path}: {e}")
-                        result['status'] = 'fail'
+        # 单次遍历完成所有模式匹配，命中即删除；__pycache__ 整目录删除、不再进入
+        for _, entry in iter_files(root, CLEANUP_EXCLUDED_DIRS, CLEANUP_DIR_NAMES):
+            name = entry.name
+            if not (name.endswith(CLEANUP_SUFFIXES) or name in CLEANUP_DIR_NAMES or name.startswith(STALE_PREFIX)):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+                cleaned_files.append(entry.path[prefix_len:])
+            except Exception as e:
+                result['issues'].append(f"清理失败 {entry.path}: {e}")
+                result['status'] = 'fail'
 
         result['details']['cleaned_files'] = cleaned_files
-        self.issues.extend(result['issues'])
         return result
 
     def parse_todo_content(self, content: str) -> List[Dict[str, Any]]:
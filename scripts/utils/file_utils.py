@@ -13,6 +13,12 @@ from typing import Dict, Any, Optional, Union, List
 import shutil
 import tempfile
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def read_json(file_path: Union[str, Path]) -> Dict[str, Any]:
     """读取JSON文件"""
@@ -31,6 +37,17 @@ def write_json(
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # orjson 直接输出 UTF-8 字节；其紧凑格式与 json.dump 的分隔符不同，只用于 2 空格缩进
+    if ORJSON_AVAILABLE and indent == 2:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+        except TypeError:
+            payload = None
+        if payload is not None:
+            with open(file_path, "wb") as f:
+                f.write(payload)
+            return
+
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
@@ -0,0 +1 @@
+"""scripts/ 下健康检查脚本的测试"""
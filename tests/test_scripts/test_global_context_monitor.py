@@ -0,0 +1,87 @@
+"""全局上下文监控器测试"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.health.global_context_monitor import GlobalContextMonitor
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    (tmp_path / "src").mkdir()
+    m = GlobalContextMonitor()
+    m.project_root = tmp_path
+    return m
+
+
+def _references(monitor, config):
+    report = {"path_references": {}}
+    monitor.check_path_references(config, "cfg.json", report)
+    return report["path_references"]
+
+
+def test_only_dict_values_are_checked(monitor):
+    config = {
+        "root": "/src",
+        "missing": "/nope",
+        "relative": "src",
+        "nested": {"inner": "/src"},
+    }
+    assert _references(monitor, config) == {
+        "cfg.json:root": "valid",
+        "cfg.json:missing": "broken",
+        "cfg.json:nested.inner": "valid",
+    }
+
+
+def test_list_of_strings_is_not_checked(monitor):
+    config = {"paths": ["/src", "/nope"], "items": [{"path": "/nope"}, ["/src"]]}
+    assert _references(monitor, config) == {"cfg.json:items[0].path": "broken"}
+
+
+def test_top_level_list_is_descended(monitor):
+    assert _references(monitor, ["/src", {"path": "/src"}]) == {"cfg.json:[1].path": "valid"}
+
+
+@pytest.mark.parametrize("config", [5, "/src", None, True])
+def test_scalar_root_is_ignored(monitor, config):
+    assert _references(monitor, config) == {}
+
+
+def test_order_matches_depth_first_traversal(monitor):
+    config = {"a": {"b": "/src", "c": {"d": "/x"}}, "e": "/y", "f": [{"g": "/z"}]}
+    assert list(_references(monitor, config)) == [
+        "cfg.json:a.b",
+        "cfg.json:a.c.d",
+        "cfg.json:e",
+        "cfg.json:f[0].g",
+    ]
+
+
+@pytest.fixture
+def scan_monitor(monitor, tmp_path):
+    src = tmp_path / "src"
+    for name in ("a.py", "b.py", "c.py"):
+        (src / name).write_text("", encoding="utf-8")
+    monitor.context_config_path = tmp_path / "ctx.json"
+    monitor.critical_paths = {"src": src}
+    return monitor
+
+
+def test_scan_keeps_full_issue_lists_by_default(scan_monitor):
+    result = scan_monitor.scan_project_structure()
+    assert len(result["orphaned_files"]) == result["orphaned_files_count"] == 3
+    assert len(result["missing_associations"]) == result["missing_associations_count"]
+
+
+def test_scan_sample_limit_caps_lists_not_counts(scan_monitor):
+    scan_monitor.sample_limit = 1
+    result = scan_monitor.scan_project_structure()
+    assert len(result["orphaned_files"]) == 1
+    assert result["orphaned_files_count"] == 3
+    assert len(result["missing_associations"]) == 1
+    assert result["missing_associations_count"] > 1
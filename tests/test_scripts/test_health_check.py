@@ -0,0 +1,92 @@
+"""健康检测脚本中端口探测与 PATH 扫描的测试"""
+
+import logging
+import os
+import shutil
+import socket
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# health_check 以相对路径导入 scripts.logging_utils，而该模块在仓库中位于 scripts/utils/ 下；
+# 缺失时补一个转发到 logging 的同名模块，使本测试能导入被测函数
+if "scripts.logging_utils" not in sys.modules:
+    try:
+        import scripts.logging_utils  # noqa: F401
+    except ImportError:
+        _logger = logging.getLogger("health_check")
+        _fallback = types.ModuleType("scripts.logging_utils")
+        _fallback.info, _fallback.warning, _fallback.error = _logger.info, _logger.warning, _logger.error
+        sys.modules["scripts.logging_utils"] = _fallback
+
+from scripts.health_check import find_executables, probe_ports
+
+
+def _old_check_port(host, port, timeout=1):
+    """改写前的单端口阻塞探测，作为判定结果的对照"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((host, port)) == 0
+    except Exception:
+        return False
+    finally:
+        sock.close()
+
+
+@pytest.fixture
+def listening_port():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    yield server.getsockname()[1]
+    server.close()
+
+
+@pytest.fixture
+def closed_port():
+    # 绑定但不监听：端口不会被其他进程占用，连接会被立即拒绝
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    yield sock.getsockname()[1]
+    sock.close()
+
+
+def test_probe_ports_matches_old_check(listening_port, closed_port):
+    ports = [listening_port, closed_port, listening_port]
+    expected = [_old_check_port("127.0.0.1", port) for port in ports]
+    assert expected == [True, False, True]
+    assert probe_ports("127.0.0.1", ports, 1.0) == expected
+
+
+def test_probe_ports_empty():
+    assert probe_ports("127.0.0.1", [], 1.0) == []
+
+
+@pytest.mark.skipif(os.name == "nt", reason="依赖 POSIX 可执行权限位")
+def test_find_executables_matches_shutil_which(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    def make(directory, name, mode):
+        target = directory / name
+        target.write_text("#!/bin/sh\n")
+        target.chmod(mode)
+
+    make(first, "xdg-open", 0o755)
+    make(first, "gnome-open", 0o644)      # 无执行权限
+    make(second, "gnome-open", 0o755)     # 排在后面的目录中才可执行
+    (first / "kioclient").mkdir()         # 同名目录不算可执行文件
+    path = os.pathsep.join([str(first), str(tmp_path / "missing"), str(second)])
+    monkeypatch.setenv("PATH", path)
+
+    names = ("xdg-open", "x-www-browser", "gnome-open", "kioclient")
+    expected = {name for name in names if shutil.which(name, path=path) is not None}
+    assert expected == {"xdg-open", "gnome-open"}
+    assert find_executables(names) == expected
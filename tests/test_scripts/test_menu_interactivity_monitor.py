@@ -0,0 +1,171 @@
+"""菜单互动性监控器测试"""
+
+import os
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.health import menu_interactivity_monitor as mim
+from scripts.health.menu_interactivity_monitor import (
+    MenuInteractivityMonitor,
+    has_nested_menu_events,
+    has_nested_ul,
+    is_minified_bundle,
+    scan_ul_tags,
+)
+
+# 改写前的实现（str + re.DOTALL），作为判定结果的对照
+OLD_NESTED_UL_RE = re.compile(r'<ul[^>]*>.*?<ul[^>]*>.*?</ul>.*?</ul>', re.DOTALL)
+OLD_MENU_EVENTS_RE = re.compile(r'\.menu.*\.on\(.*\..*\.on\(', re.DOTALL)
+
+UL_SAMPLES = [
+    "",
+    "<ul><li>a</li></ul>",
+    "<ul><li><ul><li>b</li></ul></li></ul>",
+    "<ul class=\"x\"><ul class=\"sub\"></ul></ul>",
+    "<ul></ul><ul></ul>",
+    "<ul></ul><ul></ul></ul>",
+    "<ul><ul></ul>",
+    "<ul><ul",
+    "<ul\n class='a'>\n<ul\n>\n</ul>\n</ul>",
+    "</ul></ul><ul><ul>",
+    "<ul><ul><ul></ul></ul></ul>",
+]
+
+MENU_EVENT_SAMPLES = [
+    "",
+    "$('.menu').on('click', f)",
+    "$('.menu').on('click', f); $('.item').on('hover', g)",
+    "$('.menu').on('click', function () {\n  $(this).on('x', g);\n})",
+    ".on(.menu.on(",
+    ".menu.on(.on(",
+    ".menu.on(x.on(",
+    ".menu\n.on(\n.\n.on(",
+]
+
+
+def _random_markup(rng, alphabet, length):
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+@pytest.mark.parametrize("text", UL_SAMPLES)
+def test_nested_ul_matches_old_regex(text):
+    assert has_nested_ul(text.encode()) == bool(OLD_NESTED_UL_RE.search(text))
+
+
+def test_nested_ul_matches_old_regex_on_random_markup():
+    rng = random.Random(0)
+    alphabet = ["<ul", ">", "</ul>", "<ul>", " class=\"a\"", "<li>", "x", "\n"]
+    for _ in range(2000):
+        text = _random_markup(rng, alphabet, rng.randint(0, 12))
+        assert has_nested_ul(text.encode()) == bool(OLD_NESTED_UL_RE.search(text)), text
+
+
+@pytest.mark.parametrize("text", UL_SAMPLES)
+def test_ul_counts_match_old_count(text):
+    assert scan_ul_tags(text.encode()) == (text.count('<ul'), text.count('</ul>'))
+
+
+@pytest.mark.parametrize("text", MENU_EVENT_SAMPLES)
+def test_menu_events_match_old_regex(text):
+    assert has_nested_menu_events(text.encode()) == bool(OLD_MENU_EVENTS_RE.search(text))
+
+
+def test_menu_events_match_old_regex_on_random_script():
+    rng = random.Random(0)
+    alphabet = [".menu", ".on(", ".", "on(", "menu", "x", "\n"]
+    for _ in range(2000):
+        text = _random_markup(rng, alphabet, rng.randint(0, 10))
+        assert has_nested_menu_events(text.encode()) == bool(OLD_MENU_EVENTS_RE.search(text)), text
+
+
+def test_structure_violations_skip_tag_balance_when_truncated():
+    monitor = MenuInteractivityMonitor()
+    content = b"<ul><li><ul><li>a</li></ul>"
+    types = [kind for kind, _ in monitor.check_menu_structure_violations(content)]
+    assert types == ["unclosed_tags"]
+    assert monitor.check_menu_structure_violations(content, truncated=True) == []
+
+
+def test_minified_bundle_by_name():
+    assert is_minified_bundle("static/js/jquery.min.js", b"a\nb\nc\nd\ne\n")
+    assert not is_minified_bundle("static/js/min.js", b"a\nb\nc\nd\ne\n")
+
+
+def test_minified_bundle_by_newline_density():
+    dense = b"x" * mim.MINIFIED_PEEK_BYTES
+    readable = (b"x" * 100 + b"\n") * (mim.MINIFIED_PEEK_BYTES // 100)
+    assert is_minified_bundle("app.js", dense)
+    assert not is_minified_bundle("app.js", readable)
+    # 不足一个窥视窗口的小文件不按换行密度判断
+    assert not is_minified_bundle("app.js", b"x" * 100)
+
+
+@pytest.fixture
+def cached_monitor(tmp_path):
+    m = MenuInteractivityMonitor()
+    m.file_cache_path = tmp_path / "cache.json"
+    m.load_file_cache()
+    return m
+
+
+def _counting_analyzer(calls):
+    def analyze(file_path):
+        calls.append(file_path)
+        return {"file": file_path, "scan": len(calls)}
+    return analyze
+
+
+def _rerun(monitor):
+    monitor.save_file_cache()
+    monitor.load_file_cache()
+
+
+def test_cache_reused_when_file_unchanged(cached_monitor, tmp_path):
+    target = tmp_path / "a.html"
+    target.write_text("<ul></ul>")
+    calls = []
+    analyze = _counting_analyzer(calls)
+
+    first = cached_monitor._analyze_cached(analyze, str(target))
+    _rerun(cached_monitor)
+    second = cached_monitor._analyze_cached(analyze, str(target))
+
+    assert calls == [str(target)]
+    assert second == first
+
+
+def test_cache_invalidated_when_signature_changes(cached_monitor, tmp_path):
+    target = tmp_path / "a.html"
+    target.write_text("<ul></ul>")
+    calls = []
+    analyze = _counting_analyzer(calls)
+
+    cached_monitor._analyze_cached(analyze, str(target))
+    _rerun(cached_monitor)
+    target.write_text("<ul><ul></ul></ul>")
+    st = target.stat()
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    cached_monitor._analyze_cached(analyze, str(target))
+
+    assert calls == [str(target), str(target)]
+
+
+def test_cache_ignored_when_version_differs(cached_monitor, tmp_path, monkeypatch):
+    target = tmp_path / "a.html"
+    target.write_text("<ul></ul>")
+    calls = []
+    analyze = _counting_analyzer(calls)
+
+    cached_monitor._analyze_cached(analyze, str(target))
+    cached_monitor.save_file_cache()
+    monkeypatch.setattr(mim, "FILE_CACHE_VERSION", mim.FILE_CACHE_VERSION + 1)
+    cached_monitor.load_file_cache()
+    cached_monitor._analyze_cached(analyze, str(target))
+
+    assert calls == [str(target), str(target)]
@@ -0,0 +1,67 @@
+"""任务文档统一器测试"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.health.task_docs_unifier import TaskDocsUnifier
+
+TODO_SAMPLES = [
+    "",
+    "# TODO\n\n- [ ] 第一项\n- [x] 第二项\n",
+    "- [ ] a\n  - [x] 缩进的子任务\n\t- [ ] 制表符缩进\n",
+    "- [ ] 行尾有空格   \n- [x] 行尾有制表符\t\n",
+    "- [ ] Windows 换行\r\n- [x] b\r\n",
+    "　- [ ] 全角空格缩进　\n",
+    "- [] 无空格\n- [x]紧贴\n- [ ]\n- [",
+    "-[ ] 不是任务\n* [ ] 也不是\n",
+    "- [X] 大写 X\n- [ ] 含 [x] 的标题\n",
+]
+
+
+def _old_parse_titles(content):
+    """改写前逐行 strip 的解析结果（只取标题与完成状态）"""
+    tasks = []
+    for line in content.split('\n'):
+        line = line.strip()
+        if line.startswith('- ['):
+            completed = '[x]' in line
+            title = line.split('] ', 1)[1] if '] ' in line else line
+            tasks.append((title, completed))
+    return tasks
+
+
+@pytest.fixture
+def unifier(tmp_path):
+    return TaskDocsUnifier(tmp_path)
+
+
+def _titles(unifier, content):
+    return [(task['title'], task['completed']) for task in unifier._parse_todo_content(content)]
+
+
+@pytest.mark.parametrize("content", TODO_SAMPLES)
+def test_tasks_match_old_parser(unifier, content):
+    assert _titles(unifier, content) == _old_parse_titles(content)
+
+
+def test_tasks_match_old_parser_on_random_content(unifier):
+    rng = random.Random(0)
+    alphabet = ["- [", "- [ ] ", "- [x] ", "] ", "  ", "\t", "　", "\r", "\n", "a", "x"]
+    for _ in range(2000):
+        content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert _titles(unifier, content) == _old_parse_titles(content), repr(content)
+
+
+def test_indented_lines_become_details(unifier):
+    content = "- [ ] 任务\n  说明一  \n    说明二\r\n普通段落\n- [x] 下一项\n  说明三\n"
+    tasks = unifier._parse_todo_content(content)
+    assert [task['details'] for task in tasks] == [["说明一", "说明二"], ["说明三"]]
+
+
+def test_details_before_first_task_are_ignored(unifier):
+    assert unifier._parse_todo_content("  孤立说明\n") == []